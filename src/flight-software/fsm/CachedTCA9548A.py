@@ -0,0 +1,95 @@
+import time
+from lib.adafruit_tca9548a import TCA9548A, TCA9548A_Channel
+
+# Control register value with every channel disabled
+_NO_CHANNEL = b"\x00"
+
+
+class CachedTCA9548A_Channel(TCA9548A_Channel):
+    """
+    TCA9548A_Channel that leaves its channel enabled on unlock and only rewrites
+    the control register when another channel was selected since.
+    Any failed transfer forgets the selection, so the next lock selects again.
+    """
+
+    def try_lock(self) -> bool:
+        tca = self.tca
+        start_time = time.monotonic()
+        while not tca.i2c.try_lock():
+            if time.monotonic() - start_time > 0.5:
+                raise TimeoutError("Unable to lock I2C bus within timeout period.")
+            time.sleep(0)
+        if tca.current_channel is not self:
+            try:
+                tca.i2c.writeto(tca.address, self.channel_switch)
+            except Exception:
+                tca.current_channel = None
+                tca.i2c.unlock()
+                raise
+            tca.current_channel = self
+        return True
+
+    def unlock(self) -> bool:
+        return self.tca.i2c.unlock()
+
+    def readfrom_into(self, address, buffer, **kwargs):
+        try:
+            return super().readfrom_into(address, buffer, **kwargs)
+        except OSError:
+            # the mux may have been reset (e.g. brown-out), select again next time
+            self.tca.current_channel = None
+            raise
+
+    def writeto(self, address, buffer, **kwargs):
+        try:
+            return super().writeto(address, buffer, **kwargs)
+        except OSError:
+            self.tca.current_channel = None
+            raise
+
+    def writeto_then_readfrom(self, address, buffer_out, buffer_in, **kwargs):
+        try:
+            return super().writeto_then_readfrom(
+                address, buffer_out, buffer_in, **kwargs
+            )
+        except OSError:
+            self.tca.current_channel = None
+            raise
+
+
+class CachedTCA9548A(TCA9548A):
+    """
+    TCA9548A that remembers the enabled channel, so back-to-back transactions on the
+    same channel share one select write instead of a select + disable each.
+    Call detach() after a batch of reads so the downstream devices do not stay
+    on the main bus next to its other devices.
+    """
+
+    def __init__(self, i2c, address):
+        super().__init__(i2c, address)
+        self.current_channel = None
+
+    def __getitem__(self, key):
+        if not 0 <= key <= 7:
+            raise IndexError("Channel must be an integer in the range: 0-7.")
+        if self.channels[key] is None:
+            self.channels[key] = CachedTCA9548A_Channel(self, key)
+        return self.channels[key]
+
+    def detach(self):
+        """
+        Disable whichever channel is still enabled, if any
+        """
+        if self.current_channel is None:
+            return
+        start_time = time.monotonic()
+        while not self.i2c.try_lock():
+            if time.monotonic() - start_time > 0.5:
+                raise TimeoutError("Unable to lock I2C bus within timeout period.")
+            time.sleep(0)
+        try:
+            self.i2c.writeto(self.address, _NO_CHANNEL)
+        finally:
+            # on failure the register state is unknown, forcing a select next time is safe
+            self.current_channel = None
+            self.i2c.unlock()
@@ -13,16 +13,33 @@ class ExtendedBeacon(Beacon):
         """
         super().__init__(*args, **kwargs)
         self.fsm_obj = fsm_obj
+        # Last (state name, payload deployed, antennas deployed) seen and the
+        # str()-ified FSM dict built from it
+        self._fsm_snapshot = None
+        self._fsm_state = {}
 
     def _build_state(self) -> OrderedDict[str, object]:
         """Build the state and add FSM info."""
         state = super()._build_state()
         if self.fsm_obj is not None:
-            state["FSM"] = {
-            "fsm_current_state": str(self.fsm_obj.curr_state_name),
-            "fsm_payload_deployed": str(self.fsm_obj.payload_deployed),
-            "fsm_antennas_deployed": str(self.fsm_obj.antennas_deployed)
-            }
+            state["FSM"] = self._build_fsm_state()
         else:
             state["FSM"] = {}
-        return state
\ No newline at end of file
+        return state
+
+    def _build_fsm_state(self) -> dict[str, str]:
+        """Return the FSM info, only re-stringifying it when the FSM values change.
+        The dict is cached and shared between beacons, so callers must not mutate it."""
+        snapshot = (
+            self.fsm_obj.curr_state_name,
+            self.fsm_obj.payload_deployed,
+            self.fsm_obj.antennas_deployed,
+        )
+        if snapshot != self._fsm_snapshot:
+            self._fsm_snapshot = snapshot
+            self._fsm_state = {
+            "fsm_current_state": str(snapshot[0]),
+            "fsm_payload_deployed": str(snapshot[1]),
+            "fsm_antennas_deployed": str(snapshot[2])
+            }
+        return self._fsm_state
@@ -1,8 +1,10 @@
 import time
 import json
-import traceback
 from lib.pysquared.cdh import CommandDataHandler
 
+# Valid values for the orient_payload_setting argument
+_VALID_ORIENT_SETTINGS = frozenset(("0", "1", "2"))
+
 class ExtendedCommandDataHandler(CommandDataHandler):
     """
     CDH extended to allow for controlling orient of payload.
@@ -15,6 +17,21 @@ class ExtendedCommandDataHandler(CommandDataHandler):
     
     command_orient_payload: str = "orient_payload"
 
+    def __init__(self, *args, **kwargs):
+        """
+        Args:
+            *args, **kwargs: All args to pass to the base CommandDataHandler class.
+        """
+        super().__init__(*args, **kwargs)
+        # Command string -> handler taking the command args, built once so
+        # dispatch is a single dict lookup per received command
+        self._cmd_table = {
+            self.command_orient_payload: self.set_orient_payload,
+            self.command_reset: lambda args: self.reset(),
+            self.command_change_radio_modulation: self.change_radio_modulation,
+            self.command_send_joke: lambda args: self.send_joke(),
+        }
+
     def listen_for_commands(self, timeout: int) -> None:
         """Listens for commands from the radio and handles them.
 
@@ -28,25 +45,16 @@ class ExtendedCommandDataHandler(CommandDataHandler):
             return
 
         try:
-            json_str = json_bytes.decode("utf-8")
-
-            msg: dict[str, str] = json.loads(json_str)
+            # json.loads accepts bytes, no need for an intermediate str
+            msg: dict[str, str] = json.loads(json_bytes)
 
             # Check for OSCAR password first
             if msg.get("password") == self.oscar_password:
                 self._log.debug("OSCAR command received", msg=msg)
-                cmd = msg.get("command")
-                if cmd is None:
-                    self._log.warning("No OSCAR command found in message", msg=msg)
-                    self._packet_manager.send(
-                        f"No OSCAR command found in message: {msg}".encode("utf-8")
-                    )
+                parsed = self._extract_cmd_and_args(msg, "OSCAR command")
+                if parsed is None:
                     return
-
-                args: list[str] = []
-                raw_args = msg.get("args")
-                if isinstance(raw_args, list):
-                    args: list[str] = raw_args
+                cmd, args = parsed
 
                 # Delay to give the ground station time to switch to listening mode
                 time.sleep(self._send_delay)
@@ -71,18 +79,10 @@ class ExtendedCommandDataHandler(CommandDataHandler):
                 return
 
             # If message has command field, execute the command
-            cmd = msg.get("command")
-            if cmd is None:
-                self._log.warning("No command found in message", msg=msg)
-                self._packet_manager.send(
-                    f"No command found in message: {msg}".encode("utf-8")
-                )
+            parsed = self._extract_cmd_and_args(msg, "command")
+            if parsed is None:
                 return
-
-            args: list[str] = []
-            raw_args = msg.get("args")
-            if isinstance(raw_args, list):
-                args: list[str] = raw_args
+            cmd, args = parsed
 
             self._log.debug("Received command message", cmd=cmd, args=args)
 
@@ -90,14 +90,9 @@ class ExtendedCommandDataHandler(CommandDataHandler):
             time.sleep(self._send_delay)
             self._packet_manager.send_acknowledgement()
 
-            if cmd == self.command_orient_payload:
-                self.set_orient_payload(args)
-            elif cmd == self.command_reset:
-                self.reset()
-            elif cmd == self.command_change_radio_modulation:
-                self.change_radio_modulation(args)
-            elif cmd == self.command_send_joke:
-                self.send_joke()
+            handler = self._cmd_table.get(cmd)
+            if handler is not None:
+                handler(args)
             else:
                 self._log.warning("Unknown command received", cmd=cmd)
                 self._packet_manager.send(
@@ -105,29 +100,62 @@ class ExtendedCommandDataHandler(CommandDataHandler):
                 )
 
         except Exception as e:
+            # The logger records the full traceback locally, only send the
+            # exception type and message over the radio
             self._log.error("Failed to process command message", err=e)
             self._packet_manager.send(
-                f"Failed to process command message: {traceback.format_exception(e)}".encode(
+                f"Failed to process command message: {type(e).__name__}: {e}".encode(
                     "utf-8"
                 )
             )
             return
 
+    def _extract_cmd_and_args(self, msg: dict, label: str):
+        """Pulls the command and its argument list out of a decoded message.
+
+        Args:
+            msg: The decoded command message.
+            label: How to name the command in the "not found" reply.
+
+        Returns:
+            A (cmd, args) tuple, or None if the message has no command field.
+        """
+        cmd = msg.get("command")
+        if cmd is None:
+            self._log.warning(f"No {label} found in message", msg=msg)
+            self._packet_manager.send(
+                f"No {label} found in message: {msg}".encode("utf-8")
+            )
+            return None
+
+        raw_args = msg.get("args")
+        args: list[str] = raw_args if isinstance(raw_args, list) else []
+        return cmd, args
+
     def set_orient_payload(self, args: list[str]):
+        if len(args) < 2:
+            self._log.debug("Not enough arguments for orient_payload command. Require setting and periodic time (periodic time only will take affect if setting = 2).")
+            return
+        orient_payload_setting = args[0]
+        # Validate and convert both args before touching the config, so a bad
+        # argument can never leave an uncommitted change behind in memory
+        setting = None
+        if str(orient_payload_setting) in _VALID_ORIENT_SETTINGS:
+            setting = int(orient_payload_setting)
+        else:
+            self._log.debug("Invalid orient payload setting.  Set as 0, 1, or 2")
+        periodic_time = None
         try:
-            if len(args) < 2:
-                self._log.debug("Not enough arguments for orient_payload command. Require setting and periodic time (periodic time only will take affect if setting = 2).")
-                return
-            orient_payload_setting = args[0]
-            orient_payload_periodic_time = args[1]
-            if str(orient_payload_setting) in ["0", "1", "2"]:
-                self._config.update_config("orient_payload_setting", int(orient_payload_setting), temporary=False)
-            else:
-                self._log.debug("Invalid orient payload setting.  Set as 0, 1, or 2")
-            if 0 < float(orient_payload_periodic_time) <= 24:
-                self._config.update_config("orient_payload_periodic_time", float(orient_payload_periodic_time), temporary=False)
-            else:
-                self._log.debug("Invalid orient payload periodic time.  Set as as float (hours) between 0, exclusive, and 24, inclusive.")
+            periodic_time = float(args[1])
         except ValueError as e:
             self._log.error("Failed to change orient modulation", err=e)
+        if periodic_time is not None and not 0 < periodic_time <= 24:
+            periodic_time = None
+            self._log.debug("Invalid orient payload periodic time.  Set as as float (hours) between 0, exclusive, and 24, inclusive.")
+        if setting is not None:
+            self._config.update_config("orient_payload_setting", setting, temporary=False, commit=False)
+        if periodic_time is not None:
+            self._config.update_config("orient_payload_periodic_time", periodic_time, temporary=False, commit=False)
+        # Persist both settings with one write
+        self._config.commit()
         self._packet_manager.send(f"New feature executed with args: {args}".encode("utf-8"))
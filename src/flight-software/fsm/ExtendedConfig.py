@@ -12,23 +12,65 @@ class ExtendedConfig(Config):
             send_delay: float = 0.2,
         """
         super().__init__(config_path)
-        self._observers = []
-        # Add new attributes if they don't exist in JSON
-        if not hasattr(self, "orient_payload_setting"):
-            self.orient_payload_setting = 1
-        if not hasattr(self, "orient_payload_periodic_time"):
-            self.orient_payload_periodic_time = 24
+        # Config key (or "*" for every key) -> callbacks taking (key, value)
+        self._observers = {}
+        # Parsed contents of the config file, kept so persistent updates
+        # don't have to re-read and re-parse it every time
+        self._json_cache = None
+        self._dirty = False
+        json_data = self._load_json()
+        # Add new attributes, using the saved values if they exist in JSON
+        self.orient_payload_setting = json_data.get("orient_payload_setting", 1)
+        self.orient_payload_periodic_time = json_data.get("orient_payload_periodic_time", 24)
 
-    def update_config(self, key: str, value, temporary: bool = False):
-        for cb in self._observers:
-                cb(key, value)
+    def _load_json(self):
+        """
+        Return the cached config file contents, reading the file only if needed
+        """
+        if self._json_cache is None:
+            with open(self.config_file, "rb") as f:
+                self._json_cache = json.loads(f.read())
+        return self._json_cache
+
+    def commit(self):
+        """
+        Write any pending persistent updates to the config file in a single write
+        """
+        if not self._dirty:
+            return
+        # Compact separators keep the encoded output (and the flash write) small
+        data = json.dumps(self._json_cache, separators=(",", ":")).encode("utf-8")
+        with open(self.config_file, "wb") as f:
+            f.write(data)
+        self._dirty = False
+
+    def register_observer(self, key: str, cb):
+        """
+        Call cb(key, value) whenever key is updated, use "*" to observe every key
+        """
+        self._observers.setdefault(key, []).append(cb)
+
+    def update_config(self, key: str, value, temporary: bool = False, commit: bool = True):
+        """
+        Set commit=False to batch several persistent updates and write them
+        together with a later call to commit().
+        """
+        for cb in self._observers.get(key, ()):
+            cb(key, value)
+        for cb in self._observers.get("*", ()):
+            cb(key, value)
         if key in ["orient_payload_setting", "orient_payload_periodic_time"]:
             setattr(self, key, value)
             if not temporary:
-                with open(self.config_file, "r") as f:
-                    json_data = json.load(f)
-                json_data[key] = value
-                with open(self.config_file, "w") as f:
-                    f.write(json.dumps(json_data))
+                self._load_json()[key] = value
+                self._dirty = True
+                if commit:
+                    self.commit()
         else:
+            if not temporary:
+                # The base class rewrites the file itself, so flush our pending
+                # changes first and drop the cached copy afterwards
+                self.commit()
             super().update_config(key, value, temporary)
+            if not temporary:
+                self._json_cache = None
@@ -0,0 +1,94 @@
+# burst_reads.py
+
+
+# ++++++++++++++++++ Imports and Installs ++++++++++++++++++ #
+from math import radians
+from struct import unpack_from
+from micropython import const
+
+
+# ++++++++++++++++++++++++ Constants ++++++++++++++++++++++++ #
+# LSM6DSOX gyro x/y/z are followed by accel x/y/z, so one auto-incremented
+# 12 byte read from OUTX_L_G gets both
+_LSM6DSOX_OUTX_L_G = const(0x22)
+# LIS2MDL X, Y and Z outputs are consecutive little-endian words from OUTX_L_REG
+_LIS2MDL_OUTX_L_REG = const(0x68)
+# 1.5 milligauss/LSB * 0.1 microtesla/milligauss, as in adafruit_lis2mdl
+_MAG_SCALE = 0.15
+
+
+# ++++++++++++++++++++ Class Definition ++++++++++++++++++++ #
+class IMUBurstReader:
+    """
+    Reads the LSM6DSOX gyro and accel outputs in one I2C transaction,
+    scaled with the driver's cached ranges like its gyro/acceleration properties
+    """
+
+    def __init__(self, lsm6dsox):
+        self._imu = lsm6dsox
+        self._reg = bytes((_LSM6DSOX_OUTX_L_G,))
+        self._buf = bytearray(12)
+
+    def read_into(self, av, acc):
+        """
+        Store the angular velocity in rad/s into av and the acceleration in m/s² into acc
+        """
+        imu = self._imu
+        buf = self._buf
+        with imu.i2c_device as i2c:
+            i2c.write_then_readinto(self._reg, buf)
+        gx, gy, gz, ax, ay, az = unpack_from("<hhhhhh", buf)
+        scale_gyro = imu._scale_gyro_data
+        av[0] = radians(scale_gyro(gx))
+        av[1] = radians(scale_gyro(gy))
+        av[2] = radians(scale_gyro(gz))
+        scale_xl = imu._scale_xl_data
+        acc[0] = scale_xl(ax)
+        acc[1] = scale_xl(ay)
+        acc[2] = scale_xl(az)
+
+
+class MagnetometerBurstReader:
+    """
+    Reads the LIS2MDL X, Y and Z outputs in one I2C transaction instead of the
+    driver's three 2 byte register reads
+    """
+
+    def __init__(self, lis2mdl):
+        self._mag = lis2mdl
+        self._reg = bytes((_LIS2MDL_OUTX_L_REG,))
+        self._buf = bytearray(6)
+
+    def read_into(self, vec):
+        """
+        Store the magnetic field in microteslas into vec
+        """
+        buf = self._buf
+        with self._mag.i2c_device as i2c:
+            i2c.write_then_readinto(self._reg, buf)
+        x, y, z = unpack_from("<hhh", buf)
+        vec[0] = x * _MAG_SCALE
+        vec[1] = y * _MAG_SCALE
+        vec[2] = z * _MAG_SCALE
+
+
+def imu_burst_reader(imu):
+    """
+    Returns an IMUBurstReader for an LSM6DSOXManager, or None for any other
+    IMUProto, which is then read through its own two calls
+    """
+    driver = getattr(imu, "_imu", None)
+    if driver is None or not hasattr(driver, "_scale_gyro_data"):
+        return None
+    return IMUBurstReader(driver)
+
+
+def magnetometer_burst_reader(magnetometer):
+    """
+    Returns a MagnetometerBurstReader for a LIS2MDLManager, or None for any other
+    MagnetometerProto, which is then read through get_magnetic_field
+    """
+    driver = getattr(magnetometer, "_magnetometer", None)
+    if driver is None or not hasattr(driver, "i2c_device"):
+        return None
+    return MagnetometerBurstReader(driver)
@@ -5,6 +5,9 @@
 # ++++++++++++++++++ Imports and Installs ++++++++++++++++++ #
 import time
 import asyncio
+from array import array
+from math import sqrt
+from fsm.data_processes.burst_reads import imu_burst_reader, magnetometer_burst_reader
 
 
 # ++++++++++++++++++++ Class Definition ++++++++++++++++++++ #
@@ -13,80 +16,132 @@ class DataProcess():
     Class with functions to grab all the data that we need
     """
 
-    def __init__(self, magnetometer, imu, battery_power_monitor):
+    def __init__(self, magnetometer, imu, battery_power_monitor, logger=None):
         self.protos_power_monitor = battery_power_monitor
         self.protos_imu = imu
+        # one 12 byte gyro+accel read per pass when the IMU is an LSM6DSOX, else None
+        self._imu_burst = imu_burst_reader(imu)
         self.protos_magnetometer = magnetometer
+        # one 6 byte read of all three axes when the magnetometer is a LIS2MDL, else None
+        self._mag_burst = magnetometer_burst_reader(magnetometer)
+        self.logger = logger
         self.last_imu_time = time.monotonic()
         self.running = True
+        # set after every full pass of run_all_data, consumers clear() it once read
+        self.data_ready = asyncio.Event()
+        # number of full run_all_data passes so far
+        self.cycles_completed = 0
+        # (name, getter) for each sensor read by refresh, each one isolated so a
+        # single sensor fault only leaves its own fields stale
+        self._getters = (
+            ("battery", self.get_data_battery),
+            ("imu", self.get_data_imu),
+            ("magnetometer", self.get_data_magnetometer_vector),
+        )
+        # vector fields are preallocated float32 arrays that are updated in place,
+        # so each reading is three item stores instead of a fresh list
         self.data = {
             "data_batt_volt" : 0.0,                     # battery voltage
-            "data_imu_av" : [0.0,0.0,0.0],              # imu angular velocity [ax, ay, az] in rad/s²
+            "data_imu_av" : array("f", (0.0,0.0,0.0)),  # imu angular velocity [ωx, ωy, ωz] in rad/s
             "data_imu_av_magnitude" : 0.0,              # imu angular velocity magnitude (Euclidian norm aka length of data_imu_av vector)
-            "data_imu_acc" : [0.0,0.0,0.0],             # imu acceleration [ax, ay, az] in m/s²" : [0.0,0.0,0.0],             # imu position
-            "data_magnetometer_vector" : [0.0,0.0,0.0]  # magnetometer vector
+            "data_imu_acc" : array("f", (0.0,0.0,0.0)), # imu acceleration [ax, ay, az] in m/s²
+            "data_magnetometer_vector" : array("f", (0.0,0.0,0.0))  # magnetometer vector
         }
 
+    def reset(self):
+        """
+        Zero every data field in place and clear cycles_completed and data_ready,
+        so one DataProcess can be reused across independent runs
+        """
+        data = self.data
+        data["data_batt_volt"] = 0.0
+        data["data_imu_av_magnitude"] = 0.0
+        for key in ("data_imu_av", "data_imu_acc", "data_magnetometer_vector"):
+            vec = data[key]
+            vec[0] = vec[1] = vec[2] = 0.0
+        self.cycles_completed = 0
+        self.data_ready.clear()
+
     def start_run_all_data(self):
         """
         This schedules a coroutine (a program that can be paused/resumed infinitely,
         allowing for scheduled concurrency).  Specifically, it schedules the 
-        run_all_data function
+        run_all_data function, and returns its task so the caller can cancel it
         """
         try:
-            asyncio.create_task(self.run_all_data())
+            return asyncio.create_task(self.run_all_data())
         except RuntimeError as e:
             print("Asyncio loop already running:", e)
 
     async def run_all_data(self):
         """
-        Run all the data-gathering functions in an infinite loop.
+        Run all the data-gathering functions in an infinite loop,
+        sleeping once per pass instead of once per reading.
         """
-        await asyncio.gather(
-            self.get_data_battery(),
-            self.get_data_imu_av(),
-            self.get_data_imu_acc(),
-            self.get_data_magnetometer_vector(),
-        )   
+        while self.running:
+            self.refresh()
+            await asyncio.sleep(1)
 
-    async def get_data_battery(self):
+    def refresh(self):
         """
-        Get battery voltage (bv)
+        Run one full pass of the data-gathering functions and signal data_ready.
+        Called by run_all_data once per pass.
+        A failing sensor is logged and skipped, the pass (and the loop) carries on.
         """
-        while self.running:
-            voltage = self.protos_power_monitor.get_bus_voltage().value
-            self.data["data_batt_volt"] = voltage
-            await asyncio.sleep(1)
+        for name, getter in self._getters:
+            try:
+                getter()
+            except Exception as e:
+                if self.logger is not None:
+                    self.logger.error("Failed to read sensor data", err=e, sensor=name)
+                else:
+                    print("Failed to read", name, "data:", e)
+        self.cycles_completed += 1
+        self.data_ready.set()
 
-    async def get_data_imu_av(self):
+    async def wait_cycles(self, n):
         """
-        Get data_imu_av and data_imu_av_magnitude
+        Wait until run_all_data has completed n more full passes, sleeping on
+        data_ready between passes. Pair with asyncio.wait_for to bound the wait.
         """
-        while self.running:
-            imu_acc_data = list(self.protos_imu.get_angular_velocity().value)
-            self.data["data_imu_av"] = imu_acc_data
-            # compute the magnitude of angular velocity
-            ωx, ωy, ωz = imu_acc_data
-            magnitude = (ωx**2 + ωy**2 + ωz**2) ** 0.5
-            self.data["data_imu_av_magnitude"] = magnitude
-            await asyncio.sleep(1)
-    
-    async def get_data_imu_acc(self):
+        target = self.cycles_completed + n
+        while self.cycles_completed < target:
+            self.data_ready.clear()
+            await self.data_ready.wait()
+
+    def get_data_battery(self):
         """
-        Get imu acceleration
+        Get battery voltage (bv)
         """
-        while self.running:
-            imu_acc_data = list(self.protos_imu.get_acceleration().value)
-            self.data["data_imu_acc"] = imu_acc_data
-            await asyncio.sleep(1)
+        voltage = self.protos_power_monitor.get_bus_voltage().value
+        self.data["data_batt_volt"] = voltage
 
-    async def get_data_magnetometer_vector(self):
+    def get_data_imu(self):
         """
-        Get magnetometer vector
+        Get data_imu_av, data_imu_av_magnitude and data_imu_acc, from one burst read
+        if the IMU supports it (see burst_reads), otherwise from the two IMUProto reads
         """
-        while self.running:
-            magnetometer_data = list(self.protos_magnetometer.get_magnetic_field().value)
-            self.data["data_magnetometer_vector"] = magnetometer_data
-            await asyncio.sleep(1)
+        imu_av = self.data["data_imu_av"]
+        imu_acc = self.data["data_imu_acc"]
+        burst = self._imu_burst
+        if burst is not None:
+            burst.read_into(imu_av, imu_acc)
+        else:
+            imu = self.protos_imu
+            imu_av[0], imu_av[1], imu_av[2] = imu.get_angular_velocity().value
+            imu_acc[0], imu_acc[1], imu_acc[2] = imu.get_acceleration().value
+        ωx, ωy, ωz = imu_av
+        self.data["data_imu_av_magnitude"] = sqrt(ωx*ωx + ωy*ωy + ωz*ωz)
+
+    def get_data_magnetometer_vector(self):
+        """
+        Get magnetometer vector, from one burst read if the magnetometer supports it
+        """
+        mag_vec = self.data["data_magnetometer_vector"]
+        burst = self._mag_burst
+        if burst is not None:
+            burst.read_into(mag_vec)
+        else:
+            mag_vec[0], mag_vec[1], mag_vec[2] = self.protos_magnetometer.get_magnetic_field().value
 
     
\ No newline at end of file
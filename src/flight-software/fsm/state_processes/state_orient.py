@@ -2,13 +2,29 @@
 
 
 # ++++++++++++++ Imports/Installs ++++++++++++++ #
-import math
 import asyncio
 from lib.pysquared.sensor_reading.light import Light
 from lib.pysquared.hardware.light_sensor.manager.veml7700 import VEML7700Manager
 
+# ++++++++++++++ Constants ++++++++++++++ #
+# Face normals of the four light sensors: +X, -X, +Y, -Y
+_LIGHT_VECS = ((1, 0), (-1, 0), (0, 1), (0, -1))
+# Directions we can pull the payload towards, indexed by best_direction
+_POINT_VECS = ((1, 0), (-1, 0), (0, 1), (0, -1))
+# Reading used for a face whose sensor is missing or failed to read
+_NO_LIGHT = Light(0.0)
+
 # ++++++++++++++ Functions: Helper ++++++++++++++ #
 class StateOrient:
+    # Spring GPIO states (rx0, rx1, tx0, tx1) indexed by best_direction
+    _SPRING_TABLE = (
+        ("Activating +X spring", (True, False, False, False)),
+        ("Activating -X spring", (False, True, False, False)),
+        ("Activating +Y spring", (False, False, True, False)),
+        ("Activating -Y spring", (False, False, False, True)),
+    )
+    _SPRING_OFF = (False, False, False, False)
+
     def __init__(self, dp_obj, logger, config, tca, rx0, rx1, tx0, tx1):
         """
         Initialize the class object
@@ -24,28 +40,17 @@ class StateOrient:
         self.tx1 = tx1
         self.config = config
         self.best_direction = -1
-
-        self.face0_sensor = None
-        self.face1_sensor = None
-        self.face2_sensor = None
-        self.face3_sensor = None
-
-        try:
-            self.face0_sensor = VEML7700Manager(logger, tca[0])
-        except Exception:
-            self.logger.debug("[WARNING] Light sensor 0 failed to initialize")
-        try:
-            self.face1_sensor = VEML7700Manager(logger, tca[1])
-        except Exception:
-            self.logger.debug("[WARNING] Light sensor 1 failed to initialize")
-        try:
-            self.face2_sensor = VEML7700Manager(logger, tca[2])
-        except Exception:
-            self.logger.debug("[WARNING] Light sensor 2 failed to initialize")
-        try:
-            self.face3_sensor = VEML7700Manager(logger, tca[3])
-        except Exception:
-            self.logger.debug("[WARNING] Light sensor 3 failed to initialize")
+        self.changed = False
+
+        # One light sensor per face, None if that sensor failed to initialize
+        self.face_sensors = []
+        for i in range(len(_LIGHT_VECS)):
+            try:
+                self.face_sensors.append(VEML7700Manager(logger, tca[i]))
+            except Exception:
+                self.logger.debug(f"[WARNING] Light sensor {i} failed to initialize")
+                self.face_sensors.append(None)
+        self._detach_sensors()
 
     @property
     def orient_payload_setting(self):
@@ -55,22 +60,6 @@ class StateOrient:
     def orient_payload_periodic_time(self):
         return self.config.orient_payload_periodic_time
 
-    def vector_mul_scalar(self, v, scalar):
-        """ Multiply two vectors by a scalar. """
-        return [v[0] * scalar, v[1] * scalar]
-    
-    def vector_add(self, v1, v2):
-        """ Add two vectors. """
-        return [v1[0]+v2[0], v1[1]+v2[1]]
-    
-    def vector_norm(self, v):
-        """ Get the norm of a vector. """
-        return math.sqrt(v[0]**2 + v[1]**2)
-    
-    def dot_product(self, v1, v2):
-        """ Compute dot product between two vectors. """
-        return v1[0]*v2[0] + v1[1]*v2[1]
-
     async def run(self):
         """
         Run the deployment sequence asynchronously
@@ -88,50 +77,36 @@ class StateOrient:
                 # step 1: get light readings
                 # lights: [scalar, scalar, scalar, scalar]
                 try:
-                    light1 = self.face0_sensor.get_light() if self.face0_sensor is not None else Light(0.0)
-                    light2 = self.face1_sensor.get_light() if self.face1_sensor is not None else Light(0.0)
-                    light3 = self.face2_sensor.get_light() if self.face2_sensor is not None else Light(0.0)
-                    light4 = self.face3_sensor.get_light() if self.face3_sensor is not None else Light(0.0)
-                    lights = [light1, light2, light3, light4]
+                    lights = [s.get_light() if s is not None else _NO_LIGHT for s in self.face_sensors]
                 # if fail, set all to 0
                 except Exception as e:
                     self.logger.debug(f"Failed to read light sensors: {e}")
-                    lights = [Light(0.0), Light(0.0), Light(0.0), Light(0.0)]
-
-                # step 2: create light vectors
-                # light_vec: [v1, v2, v3, v4]
-                pos_xvec = [1, 0]
-                neg_xvec = [-1, 0]
-                pos_yvec = [0, 1]
-                neg_yvec = [0, -1]
-                lightvecs = [pos_xvec, neg_xvec, pos_yvec, neg_yvec]
-
-                # step 3: weight the light vectors by the light reading
-                light_vec = [[0.0, 0.0] for _ in range(4)]
-                for i in range(4):
-                    light_vec[i] = self.vector_mul_scalar(lightvecs[i], lights[i]._value)
-
-                # step 4: compute the norm sum of the weighted light vectors, net_vec is the sun vector magnitude
-                # lightvecs is list of vectors, lights is list of scalars
-                weighted_vecs = [self.vector_mul_scalar(lightvecs[i], lights[i]._value) for i in range(4)]
-                net_vec = [0.0, 0.0]
-                for v in weighted_vecs:
-                    net_vec = self.vector_add(net_vec, v)
-
-                # step 5: determine all the directions from which to pull
-                # either east, west, north, or south
-                point_vecs = [[1,0], [-1,0], [0,1], [0,-1]]
-                
+                    lights = [_NO_LIGHT] * len(_LIGHT_VECS)
+                self._detach_sensors()
+
+                # step 2: light vectors are the constant face normals in _LIGHT_VECS
+
+                # step 3 + 4: weight the light vectors by the light reading and sum them,
+                # net_vec is the sun vector
+                # _LIGHT_VECS is list of vectors, lights is list of scalars
+                net_x = 0.0
+                net_y = 0.0
+                for lv, light in zip(_LIGHT_VECS, lights):
+                    net_x += lv[0] * light._value
+                    net_y += lv[1] * light._value
+                net_vec = (net_x, net_y)
+
+                # step 5: the directions from which to pull (east, west, north, south)
+                # are the constant unit vectors in _POINT_VECS
+
                 # step 6: find best alginment
-                # find maximum dot product between net_vec and point_vecs
-                max_dot_product = -float('inf')
-                for i in range(4):
-                    dot_product = sum([a * b for a, b in zip(net_vec, point_vecs[i])])
-                    if dot_product > max_dot_product:
-                        max_dot_product = dot_product
-                        if self.best_direction != -i:
-                            self.changed = True
-                        self.best_direction = i
+                # find maximum dot product between net_vec and _POINT_VECS
+                dots = [p[0]*net_x + p[1]*net_y for p in _POINT_VECS]
+                max_dot_product = max(dots)
+                best_direction = dots.index(max_dot_product)
+                if best_direction != self.best_direction:
+                    self.changed = True
+                self.best_direction = best_direction
 
 
                 # step 7: log the results
@@ -148,43 +123,30 @@ class StateOrient:
                     # 3: -Y
                 if self.changed == True:
                     self.logger.info("Turning off payload actuators, iving 2 seconds for spring to settle")
-                    self.rx0.value = False
-                    self.rx1.value = False
-                    self.tx0.value = False
-                    self.tx1.value = False
+                    self.set_springs(self._SPRING_OFF)
                 if self.best_direction == -1:
                     self.logger.info("No current through any springs")
-                    self.rx0.value = False
-                    self.rx1.value = False
-                    self.tx0.value = False
-                    self.tx1.value = False
-                if self.best_direction == 0:
-                    self.logger.info("Activating +X spring")
-                    self.rx0.value = True
-                    self.rx1.value = False
-                    self.tx0.value = False
-                    self.tx1.value = False
-                if self.best_direction == 1:
-                    self.logger.info("Activating -X spring")
-                    self.rx0.value = False
-                    self.rx1.value = True
-                    self.tx0.value = False
-                    self.tx1.value = False
-                if self.best_direction == 2:
-                    self.logger.info("Activating +Y spring")
-                    self.rx0.value = False
-                    self.rx1.value = False
-                    self.tx0.value = True
-                    self.tx1.value = False
-                if self.best_direction == 3:
-                    self.logger.info("Activating -Y spring")
-                    self.rx0.value = False
-                    self.rx1.value = False
-                    self.tx0.value = False
-                    self.tx1.value = True
+                    self.set_springs(self._SPRING_OFF)
+                else:
+                    message, spring_states = self._SPRING_TABLE[self.best_direction]
+                    self.logger.info(message)
+                    self.set_springs(spring_states)
                 # set self.changed to False at the end
                 self.changed = False
 
+    def _detach_sensors(self):
+        """ A CachedTCA9548A leaves the last channel enabled, take it off the bus
+        before anything else on it (e.g. the battery monitor) is used. """
+        if hasattr(self.tca, "detach"):
+            try:
+                self.tca.detach()
+            except Exception as e:
+                self.logger.debug(f"Failed to detach light sensors: {e}")
+
+    def set_springs(self, spring_states):
+        """ Drive the rx0, rx1, tx0, tx1 spring outputs from a 4-tuple of states. """
+        self.rx0.value, self.rx1.value, self.tx0.value, self.tx1.value = spring_states
+
     def stop(self):
         """
         Used by FSM to manually stop run()
@@ -7,8 +7,12 @@ Based on:
 https://github.com/n8many/VEML6030py/blob/master/veml6030.py
 """
 
+import time
 from enum import IntEnum, IntFlag
 
+from adafruit_bus_device.i2c_device import I2CDevice
+from micropython import const
+
 # done: VEML6031X00
 ADDRESS = [0x29, 0x10]
 
@@ -17,6 +21,8 @@ SETTING_CONF_0              = 0x00  # ALS_CONF_0
 SETTING_CONF_1              = 0x01  # ALS_CONF_1
 AMBIENT_LIGHT_DATA_L_REG    = 0x10  # ALS_DATA_L
 AMBIENT_LIGHT_DATA_H_REG    = 0x11  # ALS_DATA_H
+IR_DATA_L_REG               = 0x12  # IR_DATA_L
+IR_DATA_H_REG               = 0x13  # IR_DATA_H
 INTERRUPT_REG               = 0x06  # ALS_INT
 
 # done: ALS_GAIN
@@ -37,6 +43,9 @@ class IntegrationTime(IntEnum):
     ms200       = 0b110
     ms400       = 0b111
 
+# ALS_IT in milliseconds, indexed by IntegrationTime
+INTEGRATION_TIME_MS = (3.125, 6.25, 12.5, 25, 50, 100, 200, 400)
+
 # done: ALS_PERS
 class ProtectNum(IntEnum):
     n1 = 0b00
@@ -153,6 +162,15 @@ _lux_coeff_1_4 = {
     },
 }
 
+# Flattened copy of Tables 9 and 10 so looking up lux per count is one tuple index:
+# _RESOLUTION[(pd_div << 5) | (integration_time << 2) | gain]
+_RESOLUTION = tuple(
+    table[it][g]
+    for table in (_lux_coeff_4_4, _lux_coeff_1_4)
+    for it in range(8)
+    for g in range(4)
+)
+
 def set_bits(register: int, value, index, length=1):
     """
     Set selected bits in register and return new value
@@ -196,6 +214,11 @@ def get_bits(register, index, length=1):
 
 MAX_LUX = 120000
 MIN_LUX = 0
+MAX_COUNT = 0xFFFF
+
+# Attempts at the initial configuration write, and the pause between them (s)
+_INIT_ATTEMPTS = const(3)
+_INIT_RETRY_DELAY = 0.005
 
 
 class VEML6031(object):
@@ -204,8 +227,8 @@ class VEML6031(object):
         """
         Object for connecting to VEML6030 sensor via i2c.
 
-        :param bus: i2c bus to connect to VEML6030 sensor. Must be compatible with smbus.SMBus object
-        :type bus: smbus.SMBus
+        :param bus: i2c bus to connect to VEML6030 sensor
+        :type bus: busio.I2C or TCA9548A_Channel
         :param address: i2c address of VEML6030 sensor
         :type address: int
         """
@@ -217,13 +240,56 @@ class VEML6031(object):
 
         # Make sure the bus input is valid
         if bus is None:
-            raise ValueError("Invalid bus, must pass in SMBus object")
+            raise ValueError("Invalid bus, must pass in an I2C bus")
         self.bus = bus
+        self.i2c_device = I2CDevice(bus, address)
+
+        # Transfer buffers reused by every register access so reads and writes
+        # don't allocate: register address out, word in, and register + word out
+        self._reg_buf = bytearray(1)
+        self._word_buf = bytearray(2)
+        self._write_buf = bytearray(3)
+
+        # RAM copies of the gain, integration time and PD_DIV4 settings, plus the
+        # lux-per-count they select, so conversions don't read them back over i2c.
+        # These hold the raw register field values, which index the lookup tables directly
+        self._gain = int(Gain.x1_2)
+        self._integration_time = int(IntegrationTime.ms50)
+        self._pd_div = 0
+        self._resolution = _RESOLUTION[(self._integration_time << 2) | self._gain]
+        # RAM copy of the ALS_CONF_0/ALS_CONF_1 word, so setters only need a write
+        self._conf = 0
+
+        # Initialize sensor with default values, retrying a transient NACK
+        for attempt in range(_INIT_ATTEMPTS):
+            try:
+                self._configure(Gain.x1_2, IntegrationTime.ms50) # lowest gain
+                break
+            except OSError:
+                if attempt == _INIT_ATTEMPTS - 1:
+                    raise
+                time.sleep(_INIT_RETRY_DELAY)
+
+    def _configure(self, gain, integration_time):
+        """
+        Power on VEML6030 and set gain and integration time in one
+        read-modify-write of the ALS_CONF_0/ALS_CONF_1 word
 
-        # Initialize sensor with default values
-        self.power_on()
-        self.set_gain(Gain.x1_2) # lowest gain
-        self.set_integration_time(IntegrationTime.ms50)
+        :param gain:
+        :type gain: Gain
+        :param integration_time: Integration Time setting
+        :type integration_time: IntegrationTime
+        """
+        self._conf = self._read_register(SETTING_CONF_0)
+        conf = set_bits(self._conf, False, 0) # ALS_CONF_0 shutdown
+        conf = set_bits(conf, False, 8) # ALS_CONF_1 shutdown
+        conf = set_bits(conf, integration_time, 4, 3) # Table 1
+        conf = set_bits(conf, gain, 8 + 3, 2) # Table 2
+        self._write_conf(conf)
+        self._gain = gain & 0b11
+        self._integration_time = integration_time & 0b111
+        self._pd_div = int(get_bits(conf, 8 + 6)) # Table 2
+        self._update_resolution()
 
     def set_gain(self, gain):
         """
@@ -233,7 +299,9 @@ class VEML6031(object):
         :type gain: Gain
         :return:
         """
-        self._write_bits_to_register(SETTING_CONF_1, gain, 3, 1) # Table 2
+        self._write_conf(set_bits(self._conf, gain, 8 + 3, 2)) # Table 2
+        self._gain = gain & 0b11
+        self._update_resolution()
 
     def get_gain(self):
         """
@@ -242,7 +310,7 @@ class VEML6031(object):
         :return: Set gain value
         :rtype: Gain
         """
-        return Gain(self._read_bits_from_register(SETTING_CONF_1, 3, 1)) # Table 2
+        return Gain(self._gain)
 
     def set_integration_time(self, time):
         """
@@ -251,7 +319,27 @@ class VEML6031(object):
         :param time: Integration Time setting
         :type time: IntegrationTime
         """
-        self._write_bits_to_register(SETTING_CONF_0, time, 4, 3) # Table 1
+        self._write_conf(set_bits(self._conf, time, 4, 3)) # Table 1
+        self._integration_time = time & 0b111
+        self._update_resolution()
+
+    def set_gain_and_integration_time(self, gain, time):
+        """
+        Set gain and integration time for VEML6030 together.
+        ALS_CONF_0 and ALS_CONF_1 are the low and high bytes of the word at
+        SETTING_CONF_0, so both fields change with a single write.
+
+        :param gain:
+        :type gain: Gain
+        :param time: Integration Time setting
+        :type time: IntegrationTime
+        """
+        conf = set_bits(self._conf, time, 4, 3) # Table 1
+        conf = set_bits(conf, gain, 8 + 3, 2) # Table 2
+        self._write_conf(conf)
+        self._gain = gain & 0b11
+        self._integration_time = time & 0b111
+        self._update_resolution()
 
     def get_integration_time(self):
         """
@@ -260,7 +348,7 @@ class VEML6031(object):
         :return: Integration Time setting
         :rtype: IntegrationTime
         """
-        return IntegrationTime(self._read_bits_from_register(SETTING_CONF_0, 4, 3)) # Table 1
+        return IntegrationTime(self._integration_time)
 
     def set_pd_div(self, pd_div):
         """
@@ -269,7 +357,9 @@ class VEML6031(object):
         :param pd_div: PD_DIV4 setting (0 = 4/4, 1 = 1/4)
         :type pd_div: int
         """
-        self._write_bits_to_register(SETTING_CONF_1, pd_div, 6, 1) # Table 2
+        self._write_conf(set_bits(self._conf, pd_div, 8 + 6, 1)) # Table 2
+        self._pd_div = pd_div & 0b1
+        self._update_resolution()
 
     def get_pd_div(self):
         """
@@ -278,7 +368,7 @@ class VEML6031(object):
         :return: PD_DIV4 setting (0 = 4/4, 1 = 1/4)
         :rtype: int
         """
-        return int(self._read_bits_from_register(SETTING_CONF_1, 6, 1)) # Table 2
+        return self._pd_div
 
     def shutdown(self):
         """
@@ -286,15 +376,17 @@ class VEML6031(object):
         The current value will be saved for reading.
         No further readings will be taken until "power_on" is called.
         """
-        self._write_bits_to_register(SETTING_CONF_0, True, 0)
-        self._write_bits_to_register(SETTING_CONF_1, True, 0)
+        conf = set_bits(self._conf, True, 0) # ALS_CONF_0 shutdown
+        conf = set_bits(conf, True, 8) # ALS_CONF_1 shutdown
+        self._write_conf(conf)
     
     def power_on(self):
         """
         Powers on VEML6030 from off
         """
-        self._write_bits_to_register(SETTING_CONF_0, False, 0)
-        self._write_bits_to_register(SETTING_CONF_1, False, 0)
+        conf = set_bits(self._conf, False, 0) # ALS_CONF_0 shutdown
+        conf = set_bits(conf, False, 8) # ALS_CONF_1 shutdown
+        self._write_conf(conf)
 
     def read_light(self, compensate=True):
         """
@@ -306,15 +398,43 @@ class VEML6031(object):
         :return: Ambient light read by sensor
         :rtype: float
         """
-        count_l = self._read_register(AMBIENT_LIGHT_DATA_L_REG)
-        count_h = self._read_register(AMBIENT_LIGHT_DATA_H_REG)
-        count = (count_h << 8) | (count_l & 0xFF)
-        lux = self._calculate_lux(count)
+        lux = self._calculate_lux(self.read_count())
         # Compensate lux if high enough
         if lux > 1000 and compensate:
             lux = self._lux_compensation(lux)
         return lux
 
+    def read_count(self):
+        """
+        Reads the raw ambient light count from VEML6030.
+        ALS_DATA_H follows ALS_DATA_L, so one word read returns the whole count.
+
+        :return: Ambient light count
+        :rtype: int
+        """
+        return self._read_register(AMBIENT_LIGHT_DATA_L_REG)
+
+    def read_light_and_ir(self):
+        """
+        Reads the raw ambient light and IR counts in one burst read.
+        ALS_DATA_L through IR_DATA_H are contiguous, so both 16-bit counts come
+        back from a single transaction instead of one per register.
+
+        :return: Ambient light count and IR count
+        :rtype: tuple[int, int]
+        """
+        data = self._read_block(AMBIENT_LIGHT_DATA_L_REG, 4)
+        return data[0] | (data[1] << 8), data[2] | (data[3] << 8)
+
+    def get_resolution(self):
+        """
+        Get lux per count for the current gain, integration time and pd_div
+
+        :return: Lux per count
+        :rtype: float
+        """
+        return self._resolution
+
     def _lux_compensation(self, lux):
         """
         Compensates lux when raw lux reading is >1000. Only used when gathering readings.
@@ -341,13 +461,13 @@ class VEML6031(object):
         :return:
         :rtype: float
         """
-        g = self.get_gain()
-        it = self.get_integration_time()
-        pd_div = self.get_pd_div()
-        if pd_div == 0:
-            return count*_lux_coeff_4_4[it][g]
-        else:
-            return count*_lux_coeff_1_4[it][g]
+        return count*self._resolution
+
+    def _update_resolution(self):
+        """
+        Recompute the lux-per-count factor for the cached gain, integration time and pd_div
+        """
+        self._resolution = _RESOLUTION[(self._pd_div << 5) | (self._integration_time << 2) | self._gain]
     
     def _read_bits_from_register(self, register, index, length=1):
         """
@@ -379,6 +499,19 @@ class VEML6031(object):
         """
         self._write_register(register, set_bits(self._read_register(register), value, index, length))
 
+    def _write_conf(self, conf):
+        """
+        Write the ALS_CONF_0/ALS_CONF_1 word on VEML6030 and keep its RAM copy.
+        Skips the write if the sensor already holds this value.
+
+        :param conf: ALS_CONF_0 in the low byte, ALS_CONF_1 in the high byte
+        :type conf: int
+        """
+        if conf == self._conf:
+            return
+        self._write_register(SETTING_CONF_0, conf)
+        self._conf = conf
+
     def _read_register(self, register):
         """
         Read value from register on VEML6030
@@ -388,7 +521,27 @@ class VEML6031(object):
         :return: Word in register
         :rtype: int
         """
-        return self.bus.read_word_data(self.address, register)
+        self._reg_buf[0] = register
+        with self.i2c_device as i2c:
+            i2c.write_then_readinto(self._reg_buf, self._word_buf)
+        return self._word_buf[0] | (self._word_buf[1] << 8)
+
+    def _read_block(self, register, length):
+        """
+        Read consecutive registers on VEML6030 in a single transaction
+
+        :param register: Address of the first register to acquire
+        :type register: int
+        :param length: Number of bytes to read
+        :type length: int
+        :return: Bytes read starting at register
+        :rtype: bytearray
+        """
+        data = bytearray(length)
+        self._reg_buf[0] = register
+        with self.i2c_device as i2c:
+            i2c.write_then_readinto(self._reg_buf, data)
+        return data
 
     def _write_register(self, register, value):
         """
@@ -399,4 +552,9 @@ class VEML6031(object):
         :param value: Word to write to register
         :type value: int
         """
-        self.bus.write_word_data(self.address, register, value)
\ No newline at end of file
+        buf = self._write_buf
+        buf[0] = register
+        buf[1] = value & 0xFF
+        buf[2] = (value >> 8) & 0xFF
+        with self.i2c_device as i2c:
+            i2c.write(buf)
\ No newline at end of file
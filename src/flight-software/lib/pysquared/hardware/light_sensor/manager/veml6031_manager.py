@@ -15,8 +15,9 @@ lux_data = light_sensor.get_lux()
 import time
 
 from adafruit_tca9548a import TCA9548A_Channel
-from veml6031 import VEML6031, AMBIENT_LIGHT_DATA_H_REG, AMBIENT_LIGHT_DATA_L_REG, MAX_LUX, IntegrationTime, Gain
+from veml6031 import VEML6031, INTEGRATION_TIME_MS, MAX_LUX, IntegrationTime, Gain
 from busio import I2C
+from micropython import const
 
 from ....logger import Logger
 from ....protos.light_sensor import LightSensorProto
@@ -33,10 +34,38 @@ try:
 except ImportError:
     pass
 
+# Extra time on top of the integration time before a new reading is ready (ms)
+_SETTLE_MARGIN_MS = const(5)
+# Count above which a reading is treated as saturated (90% of MAX_COUNT)
+_SATURATION_COUNT = const(58981)
+# Count range in which get_auto_lux trusts the settings from the last sweep
+_AUTO_LUX_MIN_COUNT = const(2000)
+_AUTO_LUX_MAX_COUNT = const(55000)
+# Readings taken on the last sweep's settings before sweeping again anyway
+_AUTO_LUX_MAX_REUSE = const(20)
+
 
 class VEML6031Manager(LightSensorProto):
     """Manages the VEML6031 ambient light sensor."""
 
+    # (gain, integration time, settle seconds) tried by get_auto_lux from most to
+    # least sensitive, settling for one integration cycle so the reading reflects
+    # the new settings
+    _AUTO_LUX_CONFIGS = tuple(
+        (g, it, (INTEGRATION_TIME_MS[it] + _SETTLE_MARGIN_MS) / 1000)
+        for it in (
+            IntegrationTime.ms400,
+            IntegrationTime.ms200,
+            IntegrationTime.ms100,
+            IntegrationTime.ms50,
+            IntegrationTime.ms25,
+            IntegrationTime.ms12_5,
+            IntegrationTime.ms6_25,
+            IntegrationTime.ms3_125,
+        )
+        for g in (Gain.x2, Gain.x1, Gain.x2_3, Gain.x1_2)
+    )
+
     def __init__(
         self,
         logger: Logger,
@@ -71,6 +100,11 @@ class VEML6031Manager(LightSensorProto):
             self._log.debug("Initializing light sensor")
             self._light_sensor: VEML6031 = VEML6031(i2c)
             self._light_sensor.set_integration_time(integration_time)
+            # Set once get_auto_lux has found good settings, how many readings
+            # have reused them since, and where they sit in the search order
+            self._auto_lux_ready: bool = False
+            self._auto_lux_reuses: int = 0
+            self._auto_lux_index: int = 0
         except Exception as e:
             raise HardwareInitializationError(
                 "Failed to initialize light sensor"
@@ -86,10 +120,7 @@ class VEML6031Manager(LightSensorProto):
             SensorReadingUnknownError: If an unknown error occurs while reading the sensor.
         """
         try:
-            count_l = self._light_sensor._read_register(AMBIENT_LIGHT_DATA_L_REG)
-            count_h = self._light_sensor._read_register(AMBIENT_LIGHT_DATA_H_REG)
-            count = (count_h << 8) | (count_l & 0xFF)
-            return Light(count)
+            return Light(self._light_sensor.read_count())
         except Exception as e:
             raise SensorReadingUnknownError("Failed to get light reading") from e
 
@@ -108,7 +139,7 @@ class VEML6031Manager(LightSensorProto):
         except Exception as e:
             raise SensorReadingUnknownError("Failed to get lux reading") from e
 
-        if self._is_invalid_lux(lux):
+        if lux is None or lux == 0:
             raise SensorReadingValueError("Lux reading is invalid or zero")
 
         return Lux(lux)
@@ -116,7 +147,10 @@ class VEML6031Manager(LightSensorProto):
     def get_auto_lux(self) -> Lux:
         """Gets the auto lux reading of the sensor. This runs the sensor in auto mode
         and returns the lux value by searching through the available gain and integration time
-        combinations to find the best match.
+        combinations, from most to least sensitive, and stopping at the first reading
+        that is not saturated. While a reading on the settings from the last search stays
+        comfortably inside the sensor's range, those settings are reused without searching,
+        and if it has become too bright the search resumes from them rather than from the top.
 
         Returns:
             A Lux object containing the light level in SI lux.
@@ -126,65 +160,54 @@ class VEML6031Manager(LightSensorProto):
             SensorReadingUnknownError: If an unknown error occurs while reading the sensor.
         """
         try:
+            start = 0
+            if self._auto_lux_ready:
+                count = self._light_sensor.read_count()
+                if _AUTO_LUX_MIN_COUNT < count < _AUTO_LUX_MAX_COUNT and self._auto_lux_reuses < _AUTO_LUX_MAX_REUSE:
+                    self._auto_lux_reuses += 1
+                    return Lux(count * self._light_sensor.get_resolution())
+                if count >= _AUTO_LUX_MAX_COUNT:
+                    # Brighter than before, every more sensitive setting will saturate too
+                    start = self._auto_lux_index
+
             best_lux = 0
-            best_gain = None
-            best_it = None
-
-            gains = [Gain.x1_2, Gain.x2_3, Gain.x1, Gain.x2]
-            integration_times = [
-                IntegrationTime.ms3_125,
-                IntegrationTime.ms6_25,
-                IntegrationTime.ms12_5,
-                IntegrationTime.ms25,
-                IntegrationTime.ms50,
-                IntegrationTime.ms100,
-                IntegrationTime.ms200,
-                IntegrationTime.ms400
-            ]
-            for it in integration_times:
-                self._light_sensor.set_integration_time(it)
-                for g in gains:
-                    self._light_sensor.set_gain(g)
-                    lux = self._light_sensor.read_light(compensate=False)  # raw reading
-                    # Check if reading is within sensor limits
-                    if 0 < lux < MAX_LUX:
-                        if lux > best_lux:
-                            best_lux = lux
-                            best_gain = g
-                            best_it = it
+
+            configs = self._AUTO_LUX_CONFIGS
+            for i in range(start, len(configs)):
+                g, it, settle = configs[i]
+                self._light_sensor.set_gain_and_integration_time(g, it)
+                time.sleep(settle)
+                # Skip empty and saturated readings before converting them to lux
+                count = self._light_sensor.read_count()
+                if not 0 < count < _SATURATION_COUNT:
+                    continue
+                lux = count * self._light_sensor.get_resolution()  # raw reading
+                # The first reading within sensor limits and below full scale comes
+                # from the most sensitive usable setting, less sensitive ones only lose resolution
+                if lux < MAX_LUX:
+                    best_lux = lux
+                    self._auto_lux_index = i
+                    break
 
             if best_lux == 0:
                 raise SensorReadingValueError("Auto lux could not find a valid reading.")
             
-            # Set sensor to best combination
+            # The search stops on the best combination, so the sensor is already set to it
             lux = best_lux
-            self._light_sensor.set_gain(best_gain)
-            self._light_sensor.set_integration_time(best_it)
+            self._auto_lux_ready = True
+            self._auto_lux_reuses = 0
 
         except Exception as e:
             raise SensorReadingUnknownError("Failed to get auto lux reading") from e
 
-        if self._is_invalid_lux(lux):
-            raise SensorReadingValueError("Lux reading is invalid or zero")
-
+        # best_lux is known to be non-zero here, no need to validate it again
         return Lux(lux)
 
-    @staticmethod
-    def _is_invalid_lux(lux: float | None) -> bool:
-        """Determines if the given lux reading is invalid or zero.
-        Args:
-            lux (float | None): The lux reading to validate. It can be a float representing
-                the light level in SI lux, or None if no reading is available.
-        Returns:
-            bool: True if the lux reading is invalid (None or zero), False otherwise.
-        """
-        return lux is None or lux == 0
-
     def reset(self) -> None:
         """Resets the light sensor."""
         try:
             self._light_sensor.shutdown()
-            time.sleep(0.1)  # Allow time for the sensor to reset
+            time.sleep(0.005)  # Allow time for the sensor to reset (power-up takes ~2.5ms)
             self._light_sensor.power_on()
             self._log.debug("Light sensor reset successfully")
         except Exception as e:
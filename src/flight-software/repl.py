@@ -1,386 +1,625 @@
-import json
-import os
+import gc
+import sys
 import time
+from array import array
 
 import board
 import asyncio
 import digitalio
-from lib.adafruit_mcp230xx.mcp23017 import MCP23017
-from lib.adafruit_tca9548a import TCA9548A
-from lib.pysquared.beacon import Beacon
-from lib.pysquared.cdh import CommandDataHandler
-from lib.pysquared.config.config import Config
-from lib.pysquared.config.jokes_config import JokesConfig
-from lib.pysquared.file_validation.manager.file_validation import FileValidationManager
-from lib.pysquared.hardware.burnwire.manager.burnwire import BurnwireManager
+from busio import SPI
 from lib.pysquared.hardware.busio import _spi_init, initialize_i2c_bus
 from lib.pysquared.hardware.digitalio import initialize_pin
-from lib.pysquared.hardware.imu.manager.lsm6dsox import LSM6DSOXManager
-from lib.pysquared.hardware.light_sensor.manager.veml7700 import VEML7700Manager
-from lib.pysquared.hardware.load_switch.manager.loadswitch_manager import (
-    LoadSwitchManager,
-)
-from lib.pysquared.hardware.magnetometer.manager.lis2mdl import LIS2MDLManager
-from lib.pysquared.hardware.power_monitor.manager.ina219 import INA219Manager
-from lib.pysquared.hardware.radio.manager.rfm9x import RFM9xManager
-from lib.pysquared.hardware.radio.manager.sx1280 import SX1280Manager
-from lib.pysquared.hardware.radio.packetizer.packet_manager import PacketManager
-from lib.pysquared.hardware.temperature_sensor.manager.mcp9808 import MCP9808Manager
+from lib.pysquared.hardware.exception import HardwareInitializationError
 from lib.pysquared.logger import Logger
 from lib.pysquared.nvm.counter import Counter
 from lib.pysquared.protos.power_monitor import PowerMonitorProto
-from lib.pysquared.rtc.manager.microcontroller import MicrocontrollerManager
-from lib.pysquared.watchdog import Watchdog
-from version import __version__
-from fsm.data_processes.data_process import DataProcess
-from fsm.ExtendedBeacon import ExtendedBeacon
-from fsm.ExtendedCDH import ExtendedCommandDataHandler
 from fsm.ExtendedConfig import ExtendedConfig
-from fsm.fsm import FSM
+from micropython import const
+
+
+# ----- Constants ----- #
+_I2C_FREQUENCY = const(400000)
+_IMU_ADDRESS = const(0x6B)
+_BATTERY_MONITOR_ADDRESS = const(0x40)
+_TCA_ADDRESS = const(0x77)
+_MCP_ENABLE_HEATER = const(0)
+_MCP_PAYLOAD_PWR_ENABLE = const(1)
+_MCP_PAYLOAD_BATT_ENABLE = const(3)
+_MCP_RF2_IO0 = const(6)
+# floats cannot be const()
+_SBAND_FREQUENCY_GHZ = 2.4
+_PACKET_SEND_DELAY = 0.2
+# longest wait, in seconds, for one DataProcess pass in the dm_obj update test
+_DM_CYCLE_TIMEOUT = 2.0
+# Set to True to keep the error and message counters in NVM during test runs
+_PERSIST_COUNTERS = False
+# colored test result tags, printed ahead of the test name
+_PASS = "\033[92mPASSED\033[0m"
+_FAIL = "\033[91mFAILED\033[0m"
+# indexed by a test's pass/fail bool
+_STATUS = (_FAIL, _PASS)
 
 
 # ----- Initializations ----- #
+class RAMCounter:
+    """
+    Stand-in for Counter that keeps its 8-bit value in RAM, so test runs
+    never write to NVM.
+    """
+    __slots__ = ("_index", "_value")
+
+    def __init__(self, index, value=0):
+        self._index = index
+        self._value = value & 0xFF
+
+    def get(self):
+        return self._value
+
+    def increment(self):
+        self._value = (self._value + 1) & 0xFF
+
+    def get_name(self):
+        return f"{self.__class__.__name__}_index_{self._index}"
+
+_ram_counters = {}
+
+def _make_counter(index):
+    """
+    Counter for NVM index, or while counters are not persisted a RAMCounter that
+    is shared by every caller asking for the same index, like the NVM slot would be.
+    """
+    if _PERSIST_COUNTERS:
+        return Counter(index)
+    if index not in _ram_counters:
+        _ram_counters[index] = RAMCounter(index)
+    return _ram_counters[index]
+
+# Read the clock once at import, the beacons share it as their boot time
+_BOOT_TIME = time.monotonic()
+
+# Only the logger and config are created at import time. Each device is brought up
+# by its get_*() accessor the first time a test needs it, and reused after that.
 logger: Logger = Logger(
-    error_counter=Counter(0),
+    error_counter=_make_counter(0),
     colorized=False,
 )
 
 config: ExtendedConfig = ExtendedConfig("config.json")
-jokes_config: JokesConfig = JokesConfig("jokes.json")
 
-# manually set the pin high to allow mcp to be detected
-GPIO_RESET = (
-    initialize_pin(logger, board.GPIO_EXPANDER_RESET, digitalio.Direction.OUTPUT, True),
-)
 
-i2c1 = initialize_i2c_bus(
-    logger,
-    board.SCL1,
-    board.SDA1,
-    100000,
-)
+def _cached(factory):
+    """Memoize a zero-argument factory so its device is only initialized once."""
+    cache = []
 
-i2c0 = initialize_i2c_bus(
-    logger,
-    board.SCL0,
-    board.SDA0,
-    100000,
-)
+    def get():
+        if not cache:
+            cache.append(factory())
+        return cache[0]
 
-spi0 = _spi_init(
-    logger,
-    board.SPI0_SCK,
-    board.SPI0_MOSI,
-    board.SPI0_MISO,
-)
+    return get
 
-spi1 = _spi_init(
-    logger,
-    board.SPI1_SCK,
-    board.SPI1_MOSI,
-    board.SPI1_MISO,
-)
 
-mcp = MCP23017(i2c1)
-ENABLE_HEATER = mcp.get_pin(0)
-PAYLOAD_PWR_ENABLE = mcp.get_pin(1)
-PAYLOAD_BATT_ENABLE = mcp.get_pin(3)
-ENABLE_HEATER.direction = digitalio.Direction.OUTPUT
-PAYLOAD_PWR_ENABLE.direction = digitalio.Direction.OUTPUT
-PAYLOAD_BATT_ENABLE.direction = digitalio.Direction.OUTPUT
+class CachedSPI:
+    """
+    Wraps an SPI bus and only applies configure() when the settings differ from the
+    ones last applied. SPIDevice reconfigures the bus on every transaction, which is
+    redundant when every device on the bus uses the same settings. Only the calls
+    SPIDevice makes (plus frequency and deinit) are forwarded.
+    """
+    __slots__ = ("_spi", "_config")
 
-# set these to high so that we have the circuitry ready for use
-PAYLOAD_PWR_ENABLE.value = True
-PAYLOAD_BATT_ENABLE.value = True
+    def __init__(self, spi):
+        self._spi = spi
+        self._config = None
 
-SPI0_CS0 = initialize_pin(logger, board.SPI0_CS0, digitalio.Direction.OUTPUT, True)
+    def configure(self, *, baudrate=100000, polarity=0, phase=0, bits=8):
+        config = (baudrate, polarity, phase, bits)
+        if config != self._config:
+            self._spi.configure(baudrate=baudrate, polarity=polarity, phase=phase, bits=bits)
+            self._config = config
 
-SPI1_CS0 = initialize_pin(logger, board.SPI1_CS0, digitalio.Direction.OUTPUT, True)
+    def try_lock(self):
+        return self._spi.try_lock()
 
-RF2_IO0 = mcp.get_pin(6)
+    def unlock(self):
+        self._spi.unlock()
 
-rtc = MicrocontrollerManager()
+    def write(self, buffer, **kwargs):
+        self._spi.write(buffer, **kwargs)
 
-magnetometer = LIS2MDLManager(logger, i2c1)
+    def readinto(self, buffer, **kwargs):
+        self._spi.readinto(buffer, **kwargs)
 
-imu = LSM6DSOXManager(logger, i2c1, 0x6B)
+    def write_readinto(self, buffer_out, buffer_in, **kwargs):
+        self._spi.write_readinto(buffer_out, buffer_in, **kwargs)
 
-burnwire_heater_enable = initialize_pin(
-    logger, board.FIRE_DEPLOY1_A, digitalio.Direction.OUTPUT, False
-)
+    @property
+    def frequency(self):
+        return self._spi.frequency
 
-burnwire1_fire = initialize_pin(
-    logger, board.FIRE_DEPLOY1_B, digitalio.Direction.OUTPUT, False
-)
+    def deinit(self):
+        self._config = None
+        self._spi.deinit()
 
-antenna_deployment = BurnwireManager(
-    logger, burnwire_heater_enable, burnwire1_fire, enable_logic=True
-)
 
-battery_power_monitor: PowerMonitorProto = INA219Manager(logger, i2c0, 0x40)
+def _bulk_init_pins(logger, specs):
+    """
+    Initialize a group of output pins from (pin, direction, initial_value) specs
+    with a single log line, returning the DigitalInOut objects in spec order.
+    """
+    logger.debug("Initializing pins", count=len(specs))
+    try:
+        pins = tuple(digitalio.DigitalInOut(pin) for pin, _, _ in specs)
+        for dio, (_, direction, initial_value) in zip(pins, specs):
+            dio.direction = direction
+            dio.value = initial_value
+        return pins
+    except Exception as e:
+        raise HardwareInitializationError("Failed to initialize pins") from e
+
+
+@_cached
+def get_jokes_config():
+    from lib.pysquared.config.jokes_config import JokesConfig
+    return JokesConfig("jokes.json")
+
+
+@_cached
+def get_gpio_reset():
+    # manually set the pin high to allow mcp to be detected
+    return initialize_pin(logger, board.GPIO_EXPANDER_RESET, digitalio.Direction.OUTPUT, True)
 
-uhf_radio = RFM9xManager(
-    logger,
-    config.radio,
-    spi0,
-    SPI0_CS0,
-    initialize_pin(logger, board.RF1_RST, digitalio.Direction.OUTPUT, True),
-)
 
-uhf_packet_manager = PacketManager(
-    logger,
-    uhf_radio,
-    config.radio.license,
-    Counter(2),
-    0.2,
-)
+@_cached
+def get_i2c1():
+    return initialize_i2c_bus(
+        logger,
+        board.SCL1,
+        board.SDA1,
+        _I2C_FREQUENCY,
+    )
+
+
+@_cached
+def get_i2c0():
+    return initialize_i2c_bus(
+        logger,
+        board.SCL0,
+        board.SDA0,
+        _I2C_FREQUENCY,
+    )
+
+
+@_cached
+def get_spi0() -> SPI:
+    # CachedSPI forwards every call SPIDevice makes, so the radios take it as an SPI
+    return CachedSPI(_spi_init(  # type: ignore[return-value]
+        logger,
+        board.SPI0_SCK,
+        board.SPI0_MOSI,
+        board.SPI0_MISO,
+    ))
+
+
+@_cached
+def get_spi1() -> SPI:
+    # CachedSPI forwards every call SPIDevice makes, so the radios take it as an SPI
+    return CachedSPI(_spi_init(  # type: ignore[return-value]
+        logger,
+        board.SPI1_SCK,
+        board.SPI1_MOSI,
+        board.SPI1_MISO,
+    ))
+
+
+@_cached
+def get_mcp():
+    from lib.adafruit_mcp230xx.mcp23017 import MCP23017
+    get_gpio_reset()
+    mcp = MCP23017(get_i2c1())
+    enable_bits = (1 << _MCP_PAYLOAD_PWR_ENABLE) | (1 << _MCP_PAYLOAD_BATT_ENABLE)
+    output_bits = (1 << _MCP_ENABLE_HEATER) | enable_bits
+
+    # set the payload enables high so that we have the circuitry ready for use,
+    # latching them before the pins become outputs, then make heater + enables outputs
+    # with one IODIR write (MCP23017() has just reset every pin to an input).
+    # The latch value is explicit, not read back from the floating input levels,
+    # so the heater (and every other output) comes up low
+    mcp.gpio = enable_bits
+    mcp.iodir = 0xFFFF & ~output_bits
+    return mcp
+
+
+@_cached
+def get_rtc():
+    from lib.pysquared.rtc.manager.microcontroller import MicrocontrollerManager
+    return MicrocontrollerManager()
+
+
+@_cached
+def get_magnetometer():
+    from lib.pysquared.hardware.magnetometer.manager.lis2mdl import LIS2MDLManager
+    return LIS2MDLManager(logger, get_i2c1())
+
+
+@_cached
+def get_imu():
+    from lib.pysquared.hardware.imu.manager.lsm6dsox import LSM6DSOXManager
+    return LSM6DSOXManager(logger, get_i2c1(), _IMU_ADDRESS)
+
+
+@_cached
+def get_antenna_deployment():
+    from lib.pysquared.hardware.burnwire.manager.burnwire import BurnwireManager
+    burnwire_heater_enable, burnwire1_fire = _bulk_init_pins(logger, (
+        (board.FIRE_DEPLOY1_A, digitalio.Direction.OUTPUT, False),
+        (board.FIRE_DEPLOY1_B, digitalio.Direction.OUTPUT, False),
+    ))
+
+    return BurnwireManager(
+        logger, burnwire_heater_enable, burnwire1_fire, enable_logic=True
+    )
+
+
+@_cached
+def get_battery_power_monitor() -> PowerMonitorProto:
+    from lib.pysquared.hardware.power_monitor.manager.ina219 import INA219Manager
+    return INA219Manager(logger, get_i2c0(), _BATTERY_MONITOR_ADDRESS)
+
+
+@_cached
+def get_uhf_radio():
+    from lib.pysquared.hardware.radio.manager.rfm9x import RFM9xManager
+    spi0_cs0, rf1_rst = _bulk_init_pins(logger, (
+        (board.SPI0_CS0, digitalio.Direction.OUTPUT, True),
+        (board.RF1_RST, digitalio.Direction.OUTPUT, True),
+    ))
+    return RFM9xManager(
+        logger,
+        config.radio,
+        get_spi0(),
+        spi0_cs0,
+        rf1_rst,
+    )
+
+
+@_cached
+def get_uhf_packet_manager():
+    from lib.pysquared.hardware.radio.packetizer.packet_manager import PacketManager
+    return PacketManager(
+        logger,
+        get_uhf_radio(),
+        config.radio.license,
+        _make_counter(2),
+        _PACKET_SEND_DELAY,
+    )
+
+
+@_cached
+def get_sband_radio():
+    from lib.pysquared.hardware.radio.manager.sx1280 import SX1280Manager
+    spi1_cs0, rf2_rst, rf2_tx_en, rf2_rx_en = _bulk_init_pins(logger, (
+        (board.SPI1_CS0, digitalio.Direction.OUTPUT, True),
+        (board.RF2_RST, digitalio.Direction.OUTPUT, True),
+        (board.RF2_TX_EN, digitalio.Direction.OUTPUT, False),
+        (board.RF2_RX_EN, digitalio.Direction.OUTPUT, False),
+    ))
+    return SX1280Manager(
+        logger,
+        config.radio,
+        get_spi1(),
+        spi1_cs0,
+        rf2_rst,
+        get_mcp().get_pin(_MCP_RF2_IO0),
+        _SBAND_FREQUENCY_GHZ,
+        rf2_tx_en,
+        rf2_rx_en,
+    )
+
+
+@_cached
+def get_sband_packet_manager():
+    from lib.pysquared.hardware.radio.packetizer.packet_manager import PacketManager
+    return PacketManager(
+        logger,
+        get_sband_radio(),
+        config.radio.license,
+        _make_counter(2),
+        _PACKET_SEND_DELAY,
+    )
+
+
+@_cached
+def get_beacon_fsm():
+    from fsm.ExtendedBeacon import ExtendedBeacon
+    return ExtendedBeacon(
+        None, # will be fsm_obj soon!
+        logger,
+        config.cubesat_name,
+        get_sband_packet_manager(),
+        _BOOT_TIME,
+        get_imu(),
+    )
+
+
+@_cached
+def get_beacon():
+    from lib.pysquared.beacon import Beacon
+    return Beacon(
+        logger,
+        config.cubesat_name,
+        get_sband_packet_manager(),
+        _BOOT_TIME,
+        get_imu(),
+        get_magnetometer(),
+        get_sband_radio(),
+    )
 
-sband_radio = SX1280Manager(
-    logger,
-    config.radio,
-    spi1,
-    SPI1_CS0,
-    initialize_pin(logger, board.RF2_RST, digitalio.Direction.OUTPUT, True),
-    RF2_IO0,
-    2.4,
-    initialize_pin(logger, board.RF2_TX_EN, digitalio.Direction.OUTPUT, False),
-    initialize_pin(logger, board.RF2_RX_EN, digitalio.Direction.OUTPUT, False),
-)
 
-sband_packet_manager = PacketManager(
-    logger,
-    sband_radio,
-    config.radio.license,
-    Counter(2),
-    0.2,
-)
+# Light Sensors
+@_cached
+def get_tca():
+    from fsm.CachedTCA9548A import CachedTCA9548A
+    # the light sensors sit on the payload, which get_mcp() powers up
+    get_mcp()
+    return CachedTCA9548A(get_i2c0(), address=_TCA_ADDRESS)
+
+
+@_cached
+def get_orient_pins():
+    """Returns the (RX0, RX1, TX0, TX1) payload orient outputs."""
+    # the payload enables are latched high by get_mcp()
+    get_mcp()
+    return _bulk_init_pins(logger, (
+        (board.RX0, digitalio.Direction.OUTPUT, False),
+        (board.RX1, digitalio.Direction.OUTPUT, False),
+        (board.TX0, digitalio.Direction.OUTPUT, False),
+        (board.TX1, digitalio.Direction.OUTPUT, False),
+    ))
 
-beacon_fsm = ExtendedBeacon(
-    None, # will be fsm_obj soon!
-    logger,
-    config.cubesat_name,
-    sband_packet_manager,
-    time.monotonic(),
-    imu,
-)
 
-beacon = Beacon(
-    logger,
-    config.cubesat_name,
-    sband_packet_manager,
-    time.monotonic(),
-    imu,
-    magnetometer,
-    sband_radio,
-)
+# CDH
+@_cached
+def get_cdh():
+    from fsm.ExtendedCDH import ExtendedCommandDataHandler
+    return ExtendedCommandDataHandler(logger, config, get_uhf_packet_manager(), get_jokes_config())
 
-# Light Sensors
-tca = TCA9548A(i2c0, address=int(0x77))
-RX0_OUTPUT = initialize_pin(logger, board.RX0, digitalio.Direction.OUTPUT, False)
-RX1_OUTPUT = initialize_pin(logger, board.RX1, digitalio.Direction.OUTPUT, False)
-TX0_OUTPUT = initialize_pin(logger, board.TX0, digitalio.Direction.OUTPUT, False)
-TX1_OUTPUT = initialize_pin(logger, board.TX1, digitalio.Direction.OUTPUT, False)
 
-# CDH
-cdh = ExtendedCommandDataHandler(logger, config, uhf_packet_manager, jokes_config)
+@_cached
+def get_dm_obj():
+    from fsm.data_processes.data_process import DataProcess
+    return DataProcess(magnetometer=get_magnetometer(),
+                       imu=get_imu(),
+                       battery_power_monitor=get_battery_power_monitor(),
+                       logger=logger)
+
+
+def _make_dm_obj():
+    """Returns the one pooled DataProcess, reset so each test starts from zeroed data."""
+    dm_obj = get_dm_obj()
+    dm_obj.reset()
+    return dm_obj
+
+
+def _make_fsm(dm_obj):
+    from fsm.fsm import FSM
+    # positional, in FSM.__init__ order, so no kwargs dict is built per call
+    return FSM(dm_obj, logger, config,
+            get_antenna_deployment(), get_tca(), *get_orient_pins())
 
 # ----- Test Functions ----- #
-def test_dm_obj_initialization():
-    dm_obj = DataProcess(magnetometer=magnetometer,
-                        imu=imu,
-                        battery_power_monitor=battery_power_monitor)
+def _ask(prompt):
+    """
+    Prompt the operator and return the answer stripped and upper-cased
+    """
+    return input(prompt).strip().upper()
+
+def _ask_yn(prompt):
+    """
+    Prompt the operator and return True only for a Y answer
+    """
+    return _ask(prompt) == "Y"
+
+# Layout of the packed dm_obj snapshot compared by test_dm_obj_get_data_updates,
+# one (data key, offset, length, label) entry per field
+_SNAPSHOT_LAYOUT = (
+    ("data_batt_volt", 0, 1, "data_batt_volt"),
+    ("data_imu_av", 1, 3, "imu_av"),
+    ("data_imu_av_magnitude", 4, 1, "imu_av_mag"),
+    ("data_imu_acc", 5, 3, "imu_acc"),
+    ("data_magnetometer_vector", 8, 3, "mag_vector"),
+)
+_SNAPSHOT_LEN = const(11)
+
+class TestCtx:
+    """
+    Shared state for the dm_obj tests: the one DataProcess they all run against and
+    the scratch buffers they reuse, allocated once instead of inside each test.
+    """
+    __slots__ = ("dm_obj", "snap_before", "snap_after")
+
+    def __init__(self, dm_obj):
+        self.dm_obj = dm_obj
+        # packed before/after snapshots, laid out by _SNAPSHOT_LAYOUT
+        self.snap_before = array("f", (0.0,) * _SNAPSHOT_LEN)
+        self.snap_after = array("f", (0.0,) * _SNAPSHOT_LEN)
+
+def test_dm_obj_initialization(ctx):
+    dm_obj = ctx.dm_obj
     try:
         res = dm_obj.data
         if res is not None:
-            print("\033[92mPASSED\033[0m [dm_obj test]")
+            print(_PASS, "[dm_obj test]")
     except Exception as e:
-            print("\033[91mFAILED:\033[0m [dm_obj test]", e) 
-
-async def test_dm_obj_magnetometer():
-    dm_obj = DataProcess(magnetometer=magnetometer,
-                         imu=imu,
-                         battery_power_monitor=battery_power_monitor)
-    dm_obj.running = True       
-    dm_obj.start_run_all_data()
+            print(_FAIL, "[dm_obj test]", e) 
+
+async def _monitor_vector(ctx, key, samples=10):
+    """
+    Print samples readings of the dm_obj vector field key, one per data_ready,
+    each as soon as it is taken so the operator can watch it live.
+    """
+    # the vector is updated in place, so look it up (and the event) once
+    data_ready = ctx.dm_obj.data_ready
+    vec = ctx.dm_obj.data[key]
+    for _ in range(samples):
+        await data_ready.wait()
+        data_ready.clear()
+        print("%.3f %.3f %.3f" % (vec[0], vec[1], vec[2]))
+
+async def test_dm_obj_magnetometer(ctx):
     print("Monitor magnetoruqer for 10 seconds.  Move/don't move around FC to see if the value changes.")
-    await asyncio.sleep(1)
-    for _ in range(100):
-        print(dm_obj.data["data_magnetometer_vector"])
-        await asyncio.sleep(0.1)
-    return input("Is this acceptable? (Y/N): ").strip().upper()
-
-async def test_dm_obj_imu():
-    dm_obj = DataProcess(magnetometer=magnetometer,
-                         imu=imu,
-                         battery_power_monitor=battery_power_monitor)
-    dm_obj.running = True
-    dm_obj.start_run_all_data()
+    await _monitor_vector(ctx, "data_magnetometer_vector")
+    return _ask("Is this acceptable? (Y/N): ")
+
+async def test_dm_obj_imu(ctx):
     # imu av
     print("Monitor imu av for 10 seconds.  Move/don't move around FC to see if the value changes.")
-    await asyncio.sleep(1)
-    for _ in range(100):
-        print(dm_obj.data["data_imu_av"])
-        await asyncio.sleep(0.1)
-    input("Is the av acceptable? (Y/N): ").strip().upper()
+    await _monitor_vector(ctx, "data_imu_av")
+    _ask("Is the av acceptable? (Y/N): ")
     # imu acc
     print("Monitor imu acc for 10 seconds.  Move/don't move around FC to see if the value changes.")
-    await asyncio.sleep(1)
-    for _ in range(100):
-        print(dm_obj.data["data_imu_acc"])
-        await asyncio.sleep(0.1)
-    return input("Is the acc acceptable? (Y/N): ").strip().upper()
-
-async def test_dm_obj_battery():
-    dm_obj = DataProcess(magnetometer=magnetometer,
-                         imu=imu,
-                         battery_power_monitor=battery_power_monitor)
-    dm_obj.running = True
-    dm_obj.start_run_all_data()
+    await _monitor_vector(ctx, "data_imu_acc")
+    return _ask("Is the acc acceptable? (Y/N): ")
+
+async def test_dm_obj_battery(ctx):
+    dm_obj = ctx.dm_obj
     input("Please plug in the batteries and press Enter when done.")
     print("Voltage with batteries:", dm_obj.data["data_batt_volt"])
     input("Please unplug the batteries and press Enter when done.")
     print("Voltage without batteries:", dm_obj.data["data_batt_volt"])
-    return input("Did the voltage drop by >= 4V? (Y/N): ").strip().upper()
+    return _ask("Did the voltage drop by >= 4V? (Y/N): ")
+
+def _snapshot(dm_obj, buf):
+    """ Pack the dm_obj fields into buf in place, laid out by _SNAPSHOT_LAYOUT. """
+    data = dm_obj.data
+    mv = memoryview(buf)
+    for key, off, length, _ in _SNAPSHOT_LAYOUT:
+        if length == 1:
+            buf[off] = data[key]
+        else:
+            mv[off:off + length] = memoryview(data[key])
 
-async def test_dm_obj_get_data_updates():
-    dm_obj = DataProcess(magnetometer=magnetometer,
-                         imu=imu,
-                         battery_power_monitor=battery_power_monitor)
+def _status_line(tag, ok):
+    """
+    The PASSED/FAILED tag for ok followed by [tag], as one result line
+    """
+    return _STATUS[ok] + " [" + tag + "]\n"
+
+def _field_changed(before, after, off, length):
+    for i in range(off, off + length):
+        if before[i] != after[i]:
+            return True
+    return False
+
+async def test_dm_obj_get_data_updates(ctx):
+    dm_obj = ctx.dm_obj
+    before = ctx.snap_before
+    after = ctx.snap_after
     try:
-        # [:] allows for a shallow copy
-        battery_voltage_before = dm_obj.data["data_batt_volt"]
-        imu_av_before = dm_obj.data["data_imu_av"][:]
-        imu_av_mag_before = dm_obj.data["data_imu_av_magnitude"]
-        imu_acc_before = dm_obj.data["data_imu_acc"][:]
-        mag_vector_before = dm_obj.data["data_magnetometer_vector"][:]
-        # enable the loop once
-        dm_obj.running = True       
-        dm_obj.start_run_all_data()  
-        await asyncio.sleep(1.1)
-        # stop the infinite loop
-        # let tasks exit cleanly
-        dm_obj.running = False
-        await asyncio.sleep(0.1) 
-        # check if data was updated
-        battery_voltage_after = dm_obj.data["data_batt_volt"]
-        imu_av_after = dm_obj.data["data_imu_av"][:]
-        imu_av_mag_after = dm_obj.data["data_imu_av_magnitude"]
-        imu_acc_after = dm_obj.data["data_imu_acc"][:]
-        mag_vector_after = dm_obj.data["data_magnetometer_vector"][:]
-        if battery_voltage_before != battery_voltage_after:
-            print("\033[92mPASSED\033[0m [test_dm_obj_get_data_updates data_batt_volt]")
-        else:
-            print("\033[91mFAILED\033[0m [test_dm_obj_get_data_updates data_batt_volt]")
-        if imu_av_before != imu_av_after:
-            print("\033[92mPASSED\033[0m [test_dm_obj_get_data_updates imu_av]")
-        else:
-            print("\033[91mFAILED\033[0m [test_dm_obj_get_data_updates imu_av]")
-        if imu_av_mag_before != imu_av_mag_after:
-            print("\033[92mPASSED\033[0m [test_dm_obj_get_data_updates imu_av_mag]")
-        else:
-            print("\033[91mFAILED\033[0m [test_dm_obj_get_data_updates imu_av_mag]")
-        if imu_acc_before != imu_acc_after:
-            print("\033[92mPASSED\033[0m [test_dm_obj_get_data_updates imu_acc]")
-        else:
-            print("\033[91mFAILED\033[0m [test_dm_obj_get_data_updates imu_acc]")
-        if mag_vector_before != mag_vector_after:
-            print("\033[92mPASSED\033[0m [test_dm_obj_get_data_updates mag_vector]")
-        else:
-            print("\033[91mFAILED\033[0m [test_dm_obj_get_data_updates mag_vector]")
+        _snapshot(dm_obj, before)
+        # the shared loop is already running, wait (bounded) for its next full pass,
+        # collecting up front so a sweep is unlikely to land inside the window
+        gc.collect()
+        await asyncio.wait_for(dm_obj.wait_cycles(1), _DM_CYCLE_TIMEOUT)
+        # check if data was updated, one compare over the whole block first and
+        # the per-field compares only if something changed
+        _snapshot(dm_obj, after)
+        any_changed = before != after
+        # collect every result line and write them to the console in one call
+        sys.stdout.write("".join([
+            _status_line("test_dm_obj_get_data_updates " + label,
+                         any_changed and _field_changed(before, after, off, length))
+            for _, off, length, label in _SNAPSHOT_LAYOUT
+        ]))
     except Exception as e:
-        print("\033[91mFAILED\033[0m [test_dm_obj_get_data_updates Exception]", e)
+        print(_FAIL, "[test_dm_obj_get_data_updates Exception]", e)
+
+_DM_TESTS = (
+    test_dm_obj_get_data_updates,
+    test_dm_obj_magnetometer,
+    test_dm_obj_imu,
+    test_dm_obj_battery,
+)
+
+async def _run_dm_tests(ctx, tests=_DM_TESTS):
+    """
+    Start ctx.dm_obj's polling loop once and run the given dm_obj tests against it
+    in order, collecting garbage between tests.  The loop task is cancelled and awaited
+    at the end, so it has fully exited before this returns.
+    """
+    dm_obj = ctx.dm_obj
+    dm_obj.running = True
+    task = dm_obj.start_run_all_data()
+    gc.collect()
+    try:
+        for test in tests:
+            await test(ctx)
+            gc.collect()
+    finally:
+        dm_obj.running = False
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+# (dm_obj data overrides, expected next state) for each test_fsm_transitions step,
+# the current state is marked done before every step
+_FSM_TRANSITION_STEPS = (
+    ((), "detumble"),
+    ((("data_batt_volt", 7), ("data_imu_av_magnitude", 0.2)), "deploy"),
+    ((), "orient"),
+)
 
 def test_fsm_transitions():
-        dm_obj = DataProcess(magnetometer=magnetometer,
-                         imu=imu,
-                         battery_power_monitor=battery_power_monitor)
-        fsm_obj = FSM(dm_obj,
-                logger,
-                config,
-                deployment_switch=antenna_deployment,
-                tca=tca, rx0=RX0_OUTPUT, rx1=RX1_OUTPUT, tx0=TX0_OUTPUT, tx1=TX1_OUTPUT)
-        beacon_fsm.fsm_obj = fsm_obj
+        dm_obj = _make_dm_obj()
+        fsm_obj = _make_fsm(dm_obj)
+        get_beacon_fsm().fsm_obj = fsm_obj
 
         # Initially, FSM should be in bootup
         assert(fsm_obj.curr_state_name == "bootup")
 
-        # Simulate bootup done
-        fsm_obj.curr_state_object.done = True
-        fsm_obj.execute_fsm_step()
-        assert fsm_obj.curr_state_name == "detumble", "\033[91mFAILED\033[0m [test_fsm_transitions bootup -> detumble]"
-
-        # Simulate detumble done
-        fsm_obj.curr_state_object.done = True
-        fsm_obj.dp_obj.data["data_batt_volt"] = 7
-        fsm_obj.dp_obj.data["data_imu_av_magnitude"] = 0.2
-        fsm_obj.execute_fsm_step()
-        assert fsm_obj.curr_state_name == "deploy", "\033[91mFAILED\033[0m [test_fsm_transitions detumble -> deploy]"
-
-        # Simulate deploy done
-        fsm_obj.curr_state_object.done = True
-        fsm_obj.execute_fsm_step()
-        assert fsm_obj.curr_state_name == "orient", "\033[91mFAILED\033[0m [test_fsm_transitions deploy -> orient]"
+        prev_state = "bootup"
+        for data, expected_state in _FSM_TRANSITION_STEPS:
+            fsm_obj.curr_state_object.done = True
+            for key, value in data:
+                fsm_obj.dp_obj.data[key] = value
+            fsm_obj.execute_fsm_step()
+            assert fsm_obj.curr_state_name == expected_state, f"{_FAIL} [test_fsm_transitions {prev_state} -> {expected_state}]"
+            prev_state = expected_state
 
         # Make sure to cleanup to keep effects isolated!
         if fsm_obj.curr_state_run_asyncio_task is not None:
             fsm_obj.curr_state_object.stop()
             fsm_obj.curr_state_run_asyncio_task.cancel()
-        print("\033[92mPASSED\033[0m [test_fsm_transitions]")
+        print(_PASS, "[test_fsm_transitions]")
 
 def test_fsm_deploy_burnwire():
-    choice = input("Would you like to try the burnwire test (Y/N)?: ").strip().lower()
-    if choice == "y":
-        input("Get ready to test fire deploy 1A, press enter when ready.").strip().upper()
+    if _ask_yn("Would you like to try the burnwire test (Y/N)?: "):
+        input("Get ready to test fire deploy 1A, press enter when ready.")
         time.sleep(3)
         print("Burning for 5 seconds....")
-        antenna_deployment.burn(5)
+        get_antenna_deployment().burn(5)
         print("Finished burning.")
-        return input("Did the burnwire get hot? (Y/N): ").strip().upper()
+        return _ask("Did the burnwire get hot? (Y/N): ")
     return "N/A"
 
 def test_fsm_orient_current():
-    choice = input("Would you like to try the orient current test (Y/N)?: ").strip().lower()
-    if choice == "y":
-        input("Get ready to test RX0, press enter when ready.").strip().upper()
-        print("Running current for 5 seconds....")
-        RX0_OUTPUT.value = True
-        time.sleep(5)
-        RX0_OUTPUT.value = False
-        input("Did the wire get current? (Y/N): ").strip().upper()
-        
-        input("Get ready to test RX1, press enter when ready.").strip().upper()
-        print("Running current for 5 seconds....")
-        RX1_OUTPUT.value = True
-        time.sleep(5)
-        RX1_OUTPUT.value = False
-        input("Did the wire get current? (Y/N): ").strip().upper()
-
-        input("Get ready to test TX0, press enter when ready.").strip().upper()
-        print("Running current for 5 seconds....")
-        TX0_OUTPUT.value = True
-        time.sleep(5)
-        TX0_OUTPUT.value = False
-        input("Did the wire get current? (Y/N): ").strip().upper()
-
-        input("Get ready to test TX1, press enter when ready.").strip().upper()
-        print("Running current for 5 seconds....")
-        TX1_OUTPUT.value = True
-        time.sleep(5)
-        TX1_OUTPUT.value = False
-        input("Did the wire get current? (Y/N): ").strip().upper()
+    if _ask_yn("Would you like to try the orient current test (Y/N)?: "):
+        for name, pin in zip(("RX0", "RX1", "TX0", "TX1"), get_orient_pins()):
+            input(f"Get ready to test {name}, press enter when ready.")
+            print("Running current for 5 seconds....")
+            pin.value = True
+            time.sleep(5)
+            pin.value = False
+            _ask("Did the wire get current? (Y/N): ")
     return "N/A"
 
 def test_fsm_orient_config_change():
-    choice = input("Would you like to try the orient config change test (Y/N)?: ").strip().lower()
-    if choice == "y":
-        dm_obj = DataProcess(magnetometer=magnetometer,
-                imu=imu,
-                battery_power_monitor=battery_power_monitor)
-        fsm_obj = FSM(dm_obj,
-                logger,
-                config,
-                deployment_switch=antenna_deployment,
-                tca=tca, rx0=RX0_OUTPUT, rx1=RX1_OUTPUT, tx0=TX0_OUTPUT, tx1=TX1_OUTPUT)
+    if _ask_yn("Would you like to try the orient config change test (Y/N)?: "):
+        dm_obj = _make_dm_obj()
+        fsm_obj = _make_fsm(dm_obj)
         
         fsm_obj.set_state("orient")
 
@@ -406,38 +645,37 @@ def test_fsm_orient_config_change():
         if fsm_obj.curr_state_run_asyncio_task is not None:
             fsm_obj.curr_state_object.stop()
             fsm_obj.curr_state_run_asyncio_task.cancel()
-        return input("Did the orient mechanism and/or period change as intended? (Y/N): ").strip().upper()
+        return _ask("Did the orient mechanism and/or period change as intended? (Y/N): ")
+    return "N/A"
 
 def test_fsm_orient_command():
-    choice = input("Would you like to try the orient command test (Y/N)?: ").strip().lower()
-    if choice == "y":
-        dm_obj = DataProcess(magnetometer=magnetometer,
-                imu=imu,
-                battery_power_monitor=battery_power_monitor)
-        fsm_obj = FSM(dm_obj,
-                logger,
-                config,
-                deployment_switch=antenna_deployment,
-                tca=tca, rx0=RX0_OUTPUT, rx1=RX1_OUTPUT, tx0=TX0_OUTPUT, tx1=TX1_OUTPUT)
+    if _ask_yn("Would you like to try the orient command test (Y/N)?: "):
+        dm_obj = _make_dm_obj()
+        fsm_obj = _make_fsm(dm_obj)
         fsm_obj.set_state("orient")
         print(fsm_obj.curr_state_object.orient_payload_setting)
         print(fsm_obj.curr_state_object.orient_payload_periodic_time)
-        cdh.listen_for_commands(10)
+        get_cdh().listen_for_commands(10)
         print(fsm_obj.curr_state_object.orient_payload_setting)
         print(fsm_obj.curr_state_object.orient_payload_periodic_time)
         # Make sure to cleanup to keep effects isolated!
         if fsm_obj.curr_state_run_asyncio_task is not None:
             fsm_obj.curr_state_object.stop()
             fsm_obj.curr_state_run_asyncio_task.cancel()
-        return input("Did the orient mechanism and/or period change as intended? (Y/N): ").strip().upper()
+        return _ask("Did the orient mechanism and/or period change as intended? (Y/N): ")
+    return "N/A"
 
 def test_sband():
-    choice = input("Choose to be a receiver R or sender S.  Make sure the receiver starts up first!").strip().upper()
+    choice = _ask("Choose to be a receiver R or sender S, or anything else to skip.  Make sure the receiver starts up first!")
+    if choice not in ("R", "S"):
+        # skipped, leave the S-band radio uninitialized
+        return "N/A"
     if choice == "R":
         # Wait for any response
+        receive = get_sband_radio()._radio.receive
         start_time = time.time()
         while time.time() - start_time < 10:
-            message = sband_radio._radio.receive(keep_listening=False)
+            message = receive(keep_listening=False)
             if message:
                 received = message
                 print("Received...", received)
@@ -449,7 +687,7 @@ def test_sband():
         # Attempt to send the beacon
         print("Sending in 2 seconds...")
         time.sleep(2)
-        success = sband_radio._radio.send(b"Hello there from FCB!")
+        success = get_sband_radio()._radio.send(b"Hello there from FCB!")
         if not success:
             print("sband failed to send.")
         else:
@@ -462,15 +700,9 @@ async def test_fsm_emergency_detumble():
     Test that the FSM immediately switches to 'detumble' when 
     angular velocity magnitude exceeds emergency threshold.
     """
-    dm_obj = DataProcess(magnetometer=magnetometer,
-                        imu=imu,
-                        battery_power_monitor=battery_power_monitor)
-    fsm_obj = FSM(dm_obj,
-            logger,
-            config,
-            deployment_switch=antenna_deployment,
-            tca=tca, rx0=RX0_OUTPUT, rx1=RX1_OUTPUT, tx0=TX0_OUTPUT, tx1=TX1_OUTPUT)
-    beacon_fsm.fsm_obj = fsm_obj
+    dm_obj = _make_dm_obj()
+    fsm_obj = _make_fsm(dm_obj)
+    get_beacon_fsm().fsm_obj = fsm_obj
     
     # Initially, FSM should be in bootup
     assert(fsm_obj.curr_state_name == "bootup")
@@ -482,12 +714,12 @@ async def test_fsm_emergency_detumble():
     fsm_obj.execute_fsm_step()
 
     # FSM should immediately jump to detumble
-    assert fsm_obj.curr_state_name == "detumble", "\033[91mFAILED\033[0m [test_fsm_emergency_detumble: not transitioned to detumble]"
+    assert fsm_obj.curr_state_name == "detumble", f"{_FAIL} [test_fsm_emergency_detumble: not transitioned to detumble]"
     # Clean up asyncio task if created
     if fsm_obj.curr_state_run_asyncio_task is not None:
         fsm_obj.curr_state_object.stop()
         fsm_obj.curr_state_run_asyncio_task.cancel()
-    print("\033[92mPASSED\033[0m [test_fsm_emergency_detumble]")
+    print(_PASS, "[test_fsm_emergency_detumble]")
 
 async def test_fsm_detumble_stop_conditions():
     """
@@ -496,15 +728,9 @@ async def test_fsm_detumble_stop_conditions():
     More robust than test_fsm_transitions.
     """
     # part 1: test a successful stop detumble -> deploy
-    dm_obj = DataProcess(magnetometer=magnetometer,
-                        imu=imu,
-                        battery_power_monitor=battery_power_monitor)
-    fsm_obj = FSM(dm_obj,
-            logger,
-            config,
-            deployment_switch=antenna_deployment,
-            tca=tca, rx0=RX0_OUTPUT, rx1=RX1_OUTPUT, tx0=TX0_OUTPUT, tx1=TX1_OUTPUT)
-    beacon_fsm.fsm_obj = fsm_obj
+    dm_obj = _make_dm_obj()
+    fsm_obj = _make_fsm(dm_obj)
+    get_beacon_fsm().fsm_obj = fsm_obj
 
     # Initially, FSM should be in bootup
     assert(fsm_obj.curr_state_name == "bootup")
@@ -522,27 +748,21 @@ async def test_fsm_detumble_stop_conditions():
     fsm_obj.execute_fsm_step()
 
     # Now we should be in Deploy
-    assert fsm_obj.curr_state_name == "deploy", "\033[91mFAILED\033[0m [test_fsm_detumble_stop_conditions]"
+    assert fsm_obj.curr_state_name == "deploy", f"{_FAIL} [test_fsm_detumble_stop_conditions]"
     # Clean up asyncio task if created
     if fsm_obj.curr_state_run_asyncio_task is not None:
         fsm_obj.curr_state_object.stop()
         fsm_obj.curr_state_run_asyncio_task.cancel()
-    print("\033[92mPASSED\033[0m [test_fsm_detumble_stop_conditions [Part 1, batt and av mag both good]]")
+    print(_PASS, "[test_fsm_detumble_stop_conditions [Part 1, batt and av mag both good]]")
 
     # part 2: test a non-successful stop detumble -> deploy due to battery voltage
-    beacon_fsm.fsm_obj = None
+    get_beacon_fsm().fsm_obj = None
     fsm_obj = None
     dm_obj = None
 
-    dm_obj = DataProcess(magnetometer=magnetometer,
-                        imu=imu,
-                        battery_power_monitor=battery_power_monitor)
-    fsm_obj = FSM(dm_obj,
-            logger,
-            config,
-            deployment_switch=antenna_deployment,
-            tca=tca, rx0=RX0_OUTPUT, rx1=RX1_OUTPUT, tx0=TX0_OUTPUT, tx1=TX1_OUTPUT)
-    beacon_fsm.fsm_obj = fsm_obj
+    dm_obj = _make_dm_obj()
+    fsm_obj = _make_fsm(dm_obj)
+    get_beacon_fsm().fsm_obj = fsm_obj
 
     # Initially, FSM should be in bootup
     assert(fsm_obj.curr_state_name == "bootup")
@@ -560,12 +780,12 @@ async def test_fsm_detumble_stop_conditions():
     fsm_obj.execute_fsm_step()
 
     # We should STILL be in Detumble
-    assert fsm_obj.curr_state_name == "detumble", "\033[91mFAILED\033[0m [test_fsm_detumble_stop_conditions]"
+    assert fsm_obj.curr_state_name == "detumble", f"{_FAIL} [test_fsm_detumble_stop_conditions]"
     # Clean up asyncio task if created
     if fsm_obj.curr_state_run_asyncio_task is not None:
         fsm_obj.curr_state_object.stop()
         fsm_obj.curr_state_run_asyncio_task.cancel()
-    print("\033[92mPASSED\033[0m [test_fsm_detumble_stop_conditions [Part 2, batt too low]]")
+    print(_PASS, "[test_fsm_detumble_stop_conditions [Part 2, batt too low]]")
 
 async def test_fsm_orient_above_battery():
     """
@@ -574,15 +794,9 @@ async def test_fsm_orient_above_battery():
     """
 
     # part 1: test a successful stop detumble -> orient
-    dm_obj = DataProcess(magnetometer=magnetometer,
-                        imu=imu,
-                        battery_power_monitor=battery_power_monitor)
-    fsm_obj = FSM(dm_obj,
-            logger,
-            config,
-            deployment_switch=antenna_deployment,
-            tca=tca, rx0=RX0_OUTPUT, rx1=RX1_OUTPUT, tx0=TX0_OUTPUT, tx1=TX1_OUTPUT)
-    beacon_fsm.fsm_obj = fsm_obj
+    dm_obj = _make_dm_obj()
+    fsm_obj = _make_fsm(dm_obj)
+    get_beacon_fsm().fsm_obj = fsm_obj
     # Initially, FSM should be in bootup
     fsm_obj.payload_deployed = True
     fsm_obj.antennas_deployed = True
@@ -593,26 +807,20 @@ async def test_fsm_orient_above_battery():
     await asyncio.sleep(fsm_obj.curr_state_object.detumble_frequency + 0.1)
     fsm_obj.execute_fsm_step()
     # Now we should be in Orient
-    assert fsm_obj.curr_state_name == "orient", "\033[91mFAILED\033[0m [test_fsm_orient_above_battery]"
+    assert fsm_obj.curr_state_name == "orient", f"{_FAIL} [test_fsm_orient_above_battery]"
     # Clean up asyncio task if created
     if fsm_obj.curr_state_run_asyncio_task is not None:
         fsm_obj.curr_state_object.stop()
         fsm_obj.curr_state_run_asyncio_task.cancel()
-    beacon_fsm.fsm_obj = None
+    get_beacon_fsm().fsm_obj = None
     fsm_obj = None
     dm_obj = None
-    print("\033[92mPASSED\033[0m [test_fsm_orient_above_battery [Part 1, detumble, batt is good]]")
+    print(_PASS, "[test_fsm_orient_above_battery [Part 1, detumble, batt is good]]")
 
     # part 2: test a non-successful stop detumble -> orient
-    dm_obj = DataProcess(magnetometer=magnetometer,
-                        imu=imu,
-                        battery_power_monitor=battery_power_monitor)
-    fsm_obj = FSM(dm_obj,
-            logger,
-            config,
-            deployment_switch=antenna_deployment,
-            tca=tca, rx0=RX0_OUTPUT, rx1=RX1_OUTPUT, tx0=TX0_OUTPUT, tx1=TX1_OUTPUT)
-    beacon_fsm.fsm_obj = fsm_obj
+    dm_obj = _make_dm_obj()
+    fsm_obj = _make_fsm(dm_obj)
+    get_beacon_fsm().fsm_obj = fsm_obj
     # Initially, FSM should be in bootup
     fsm_obj.payload_deployed = True
     fsm_obj.antennas_deployed = True
@@ -623,26 +831,20 @@ async def test_fsm_orient_above_battery():
     await asyncio.sleep(fsm_obj.curr_state_object.detumble_frequency + 0.1)
     fsm_obj.execute_fsm_step()
     # Now we should be in detumble
-    assert fsm_obj.curr_state_name == "detumble", "\033[91mFAILED\033[0m [test_fsm_orient_above_battery]"
+    assert fsm_obj.curr_state_name == "detumble", f"{_FAIL} [test_fsm_orient_above_battery]"
     # Clean up asyncio task if created
     if fsm_obj.curr_state_run_asyncio_task is not None:
         fsm_obj.curr_state_object.stop()
         fsm_obj.curr_state_run_asyncio_task.cancel()
-    beacon_fsm.fsm_obj = None
+    get_beacon_fsm().fsm_obj = None
     fsm_obj = None
     dm_obj = None
-    print("\033[92mPASSED\033[0m [test_fsm_orient_above_battery [Part 2, detumble, batt is too low]]")
+    print(_PASS, "[test_fsm_orient_above_battery [Part 2, detumble, batt is too low]]")
 
     # part 3: test a successful stop deploy -> orient
-    dm_obj = DataProcess(magnetometer=magnetometer,
-                        imu=imu,
-                        battery_power_monitor=battery_power_monitor)
-    fsm_obj = FSM(dm_obj,
-            logger,
-            config,
-            deployment_switch=antenna_deployment,
-            tca=tca, rx0=RX0_OUTPUT, rx1=RX1_OUTPUT, tx0=TX0_OUTPUT, tx1=TX1_OUTPUT)
-    beacon_fsm.fsm_obj = fsm_obj
+    dm_obj = _make_dm_obj()
+    fsm_obj = _make_fsm(dm_obj)
+    get_beacon_fsm().fsm_obj = fsm_obj
     # Initially, FSM should be in bootup
     fsm_obj.payload_deployed = True
     fsm_obj.antennas_deployed = True
@@ -654,26 +856,20 @@ async def test_fsm_orient_above_battery():
     await asyncio.sleep(2)
     fsm_obj.execute_fsm_step()
     # Now we should be in Orient
-    assert fsm_obj.curr_state_name == "orient", "\033[91mFAILED\033[0m [test_fsm_orient_above_battery]"
+    assert fsm_obj.curr_state_name == "orient", f"{_FAIL} [test_fsm_orient_above_battery]"
     # Clean up asyncio task if created
     if fsm_obj.curr_state_run_asyncio_task is not None:
         fsm_obj.curr_state_object.stop()
         fsm_obj.curr_state_run_asyncio_task.cancel()
-    beacon_fsm.fsm_obj = None
+    get_beacon_fsm().fsm_obj = None
     fsm_obj = None
     dm_obj = None
-    print("\033[92mPASSED\033[0m [test_fsm_orient_above_battery [Part 3, deploy, batt is good]]")
+    print(_PASS, "[test_fsm_orient_above_battery [Part 3, deploy, batt is good]]")
 
     # part 4: test a non-successful stop deploy -> orient
-    dm_obj = DataProcess(magnetometer=magnetometer,
-                        imu=imu,
-                        battery_power_monitor=battery_power_monitor)
-    fsm_obj = FSM(dm_obj,
-            logger,
-            config,
-            deployment_switch=antenna_deployment,
-            tca=tca, rx0=RX0_OUTPUT, rx1=RX1_OUTPUT, tx0=TX0_OUTPUT, tx1=TX1_OUTPUT)
-    beacon_fsm.fsm_obj = fsm_obj
+    dm_obj = _make_dm_obj()
+    fsm_obj = _make_fsm(dm_obj)
+    get_beacon_fsm().fsm_obj = fsm_obj
     # Initially, FSM should be in bootup
     fsm_obj.payload_deployed = True
     fsm_obj.antennas_deployed = True
@@ -686,15 +882,15 @@ async def test_fsm_orient_above_battery():
     fsm_obj.execute_fsm_step()
     # We should still be in deploy
     print(fsm_obj.curr_state_name, fsm_obj.curr_state_object.is_done(), fsm_obj.dp_obj.data["data_batt_volt"])
-    assert fsm_obj.curr_state_name == "deploy", "\033[91mFAILED\033[0m [test_fsm_orient_above_battery]"
+    assert fsm_obj.curr_state_name == "deploy", f"{_FAIL} [test_fsm_orient_above_battery]"
     # Clean up asyncio task if created
     if fsm_obj.curr_state_run_asyncio_task is not None:
         fsm_obj.curr_state_object.stop()
         fsm_obj.curr_state_run_asyncio_task.cancel()
-    beacon_fsm.fsm_obj = None
+    get_beacon_fsm().fsm_obj = None
     fsm_obj = None
     dm_obj = None
-    print("\033[92mPASSED\033[0m [test_fsm_orient_above_battery [Part 4, deploy, batt is too low]]")
+    print(_PASS, "[test_fsm_orient_above_battery [Part 4, deploy, batt is too low]]")
 
 
 # ========== MAIN FUNCTION ========== #
@@ -715,9 +911,8 @@ def test_all():
     #test_sband()                                    # TESTED
 
     # dm_obj tests
-    #test_dm_obj_initialization()                     # TESTED
-    #asyncio.run(test_dm_obj_get_data_updates())      # TESTED
-    #asyncio.run(test_dm_obj_magnetometer())          # TESTED
-    #asyncio.run(test_dm_obj_imu())                   # TESTED
-    #asyncio.run(test_dm_obj_battery())               # TESTED
+    #ctx = TestCtx(_make_dm_obj())
+    #test_dm_obj_initialization(ctx)                  # TESTED
+    #asyncio.run(_run_dm_tests(ctx))                  # TESTED - get_data_updates, magnetometer, imu, battery
+    #asyncio.run(_run_dm_tests(ctx, (test_dm_obj_imu,)))  # run a single dm_obj test
     pass
\ No newline at end of file